@@ -71,7 +71,7 @@ async def get_pending_users(
     )
     pending_users = result.scalars().all()
     
-    logger.info(f"Admin {admin_user.email} retrieved pending users list")
+    logger.info("Admin %s retrieved pending users list", admin_user.email)
     
     return {
         "success": True,
@@ -125,7 +125,7 @@ async def approve_user(
     db.add(user)
     await db.commit()
     
-    logger.info(f"User {user.email} approved by admin {admin_user.email}")
+    logger.info("User %s approved by admin %s", user.email, admin_user.email)
     
     return {
         "success": True,
@@ -172,7 +172,7 @@ async def reject_user(
     await db.delete(user)
     await db.commit()
     
-    logger.info(f"User {email} rejected by admin {admin_user.email}")
+    logger.info("User %s rejected by admin %s", email, admin_user.email)
     
     return {
         "success": True,
@@ -216,7 +216,7 @@ async def get_admin_stats(
     )
     recruiters_count = len(result_recruiters.scalars().all())
     
-    logger.info(f"Admin {admin_user.email} accessed dashboard stats")
+    logger.info("Admin %s accessed dashboard stats", admin_user.email)
     
     return {
         "success": True,
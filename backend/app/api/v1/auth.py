@@ -103,7 +103,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     await db.commit()
     await db.refresh(new_user)
     
-    logger.info(f"New user registered: {new_user.email} (role: {new_user.role}, approved: {is_approved})")
+    logger.info("New user registered: %s (role: %s, approved: %s)", new_user.email, new_user.role, is_approved)
     
     # Generate token (only works if user is approved)
     access_token = create_access_token(subject=str(new_user.id))
@@ -156,13 +156,13 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     
     # NEW: Check if user is approved (unless admin)
     if not user.is_approved and user.role != "admin":
-        logger.warning(f"Login attempt by non-approved user: {user.email}")
+        logger.warning("Login attempt by non-approved user: %s", user.email)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Your account is pending admin approval. Please wait for approval email."
         )
     
-    logger.info(f"User login successful: {user.email}")
+    logger.info("User login successful: %s", user.email)
     
     # Generate token
     access_token = create_access_token(subject=str(user.id))
@@ -5,6 +5,7 @@ from app.core.database import get_db
 from app.models.candidate import Candidate
 from app.models.resume import Resume
 from app.core.security import decode_token
+from app.core.ids import uuid7
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 import uuid
@@ -75,7 +76,7 @@ async def create_candidate_profile(
     
     # Create
     candidate = Candidate(
-        id=uuid.uuid4(),
+        id=uuid7(),
         user_id=user_id,
         name=data.name,
         email=data.email,
@@ -88,7 +89,7 @@ async def create_candidate_profile(
     await db.commit()
     await db.refresh(candidate)
     
-    logger.info(f"Candidate created: {candidate.id}")
+    logger.info("Candidate created: %s", candidate.id)
     
     return {
         "message": "Candidate profile created",
@@ -256,6 +257,6 @@ async def delete_profile(
     await db.delete(candidate)
     await db.commit()
     
-    logger.info(f"Candidate deleted: {candidate.id}")
+    logger.info("Candidate deleted: %s", candidate.id)
     
     return {"message": "Profile deleted"}
\ No newline at end of file
@@ -10,6 +10,7 @@ from typing import Optional
 import uuid
 import logging
 from app.services.embeddings import get_embedding, vector_store
+from app.core.ids import uuid7
 from asyncpg import Range
 
 logger = logging.getLogger(__name__)
@@ -92,7 +93,7 @@ async def create_job(
         )
 
     job = Job(
-        id=uuid.uuid4(),
+        id=uuid7(),
         title=job_data.title,
         description=job_data.description,
         requirements=job_data.requirements,
@@ -106,7 +107,7 @@ async def create_job(
     await db.commit()
     await db.refresh(job)
 
-    logger.info(f"Job created: {job.id}")
+    logger.info("Job created: %s", job.id)
 
     try:
         job_text = f"{job.title} {job.description} {job.requirements}"
@@ -115,7 +116,7 @@ async def create_job(
             vectors=[(str(job.id), embedding, {"type": "job"})]
         )
     except Exception as e:
-        logger.warning(f"Failed to create embedding for job {job.id}: {e}")
+        logger.warning("Failed to create embedding for job %s: %s", job.id, e)
 
     return {
         "success": True,
@@ -174,7 +175,7 @@ async def list_jobs(
             "total": len(job_list)
         }
     except Exception as e:
-        logger.error(f"Error listing jobs: {e}")
+        logger.error("Error listing jobs: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to list jobs: {str(e)}")
 
 # ✅ NEW ENDPOINT: Get single job
@@ -219,5 +220,5 @@ async def get_job(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting job: {e}")
+        logger.error("Error getting job: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get job: {str(e)}")
@@ -12,6 +12,7 @@ from typing import Optional, List
 import uuid
 import logging
 from app.services.embeddings import get_embedding, vector_store
+from app.core.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
@@ -213,7 +214,7 @@ async def match_candidate_to_job(
     # Vector similarity between job text and resume text/skills
     try:
         job_text = f"{job.title}\n{job.description}\n{job.requirements}"
-        job_vec = get_embedding(job_text[:5000])
+        job_vec = get_embedding(job_text)
         # Query resumes namespace for this resume id to get a comparable score
         results = vector_store.query("resumes", job_vec, top_k=1, filter={"filename": resume.filename})
         vector_sim = results[0]["score"] if results else 0.0
@@ -242,7 +243,7 @@ async def match_candidate_to_job(
     
     # Store in database
     screening_result = ScreeningResult(
-        id=uuid.uuid4(),
+        id=uuid7(),
         job_id=job_id,
         candidate_id=candidate_id,
         resume_id=resume_id,
@@ -262,7 +263,7 @@ async def match_candidate_to_job(
     await db.commit()
     await db.refresh(screening_result)
     
-    logger.info(f"Match created: job={job_id}, candidate={candidate_id}, score={overall_score}")
+    logger.info("Match created: job=%s, candidate=%s, score=%s", job_id, candidate_id, overall_score)
     
     return {
         "message": "Candidate matched to job",
@@ -314,8 +315,14 @@ async def get_match_results(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Build query
-    query = select(ScreeningResult).where(ScreeningResult.job_id == jid)
+    # Build query: candidate and resume come back in the same round-trip
+    # instead of two extra lookups per screening result
+    query = (
+        select(ScreeningResult, Candidate, Resume)
+        .join(Candidate, Candidate.id == ScreeningResult.candidate_id)
+        .join(Resume, Resume.id == ScreeningResult.resume_id)
+        .where(ScreeningResult.job_id == jid)
+    )
     
     # Filter by minimum score if provided
     if min_score is not None:
@@ -328,36 +335,21 @@ async def get_match_results(
     query = query.offset(skip).limit(limit)
     
     result = await db.execute(query)
-    screening_results = result.scalars().all()
     
-    # Get candidate and resume details for each result
     results_with_details = []
-    for sr in screening_results:
-        # Get candidate
-        candidate_result = await db.execute(
-            select(Candidate).where(Candidate.id == sr.candidate_id)
-        )
-        candidate = candidate_result.scalars().first()
-        
-        # Get resume
-        resume_result = await db.execute(
-            select(Resume).where(Resume.id == sr.resume_id)
-        )
-        resume = resume_result.scalars().first()
-        
-        if candidate and resume:
-            results_with_details.append({
-                "screening_result_id": str(sr.id),
-                "candidate_id": str(sr.candidate_id),
-                "candidate_name": candidate.name,
-                "resume_id": str(sr.resume_id),
-                "resume_filename": resume.filename,
-                "overall_score": sr.overall_score,
-                "skill_match_score": sr.skill_match_score,
-                "experience_score": sr.experience_score,
-                "education_score": sr.education_score,
-                "created_at": sr.created_at.isoformat() if sr.created_at else None
-            })
+    for sr, candidate, resume in result.all():
+        results_with_details.append({
+            "screening_result_id": str(sr.id),
+            "candidate_id": str(sr.candidate_id),
+            "candidate_name": candidate.name,
+            "resume_id": str(sr.resume_id),
+            "resume_filename": resume.filename,
+            "overall_score": sr.overall_score,
+            "skill_match_score": sr.skill_match_score,
+            "experience_score": sr.experience_score,
+            "education_score": sr.education_score,
+            "created_at": sr.created_at.isoformat() if sr.created_at else None
+        })
     
     return {
         "job_id": str(job.id),
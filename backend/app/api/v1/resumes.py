@@ -3,8 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from typing import List
 import logging
-from app.services.rag_resume_parser import RAGResumeParser
-from app.services.resumeparser import ResumeParser, FileParseError
+from app.services.rag_resume_parser import get_rag_resume_parser
+from app.services.resumeparser import get_resume_parser, FileParseError
 from app.schemas.resumes import ParseResumeRequest, ParseResumeResponse
 import os
 from sqlalchemy import select, desc
@@ -14,6 +14,7 @@ from app.core.security import decode_token
 from app.core.config import settings
 import uuid
 from app.services.embeddings import get_embedding, vector_store
+from app.core.ids import uuid7
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 logger = logging.getLogger(__name__)
@@ -70,7 +71,7 @@ async def upload_resume(
     
     if not candidate:
         candidate = Candidate(
-            id=uuid.uuid4(),
+            id=uuid7(),
             user_id=uuid.UUID(user_id) if isinstance(user_id, str) else user_id,
             name="Candidate",
             email="candidate@example.com"
@@ -108,7 +109,7 @@ async def upload_resume(
 
     # ===== PARSE RESUME =====
     try:
-        parser = ResumeParser()
+        parser = get_resume_parser()
         
         # Determine mimetype
         if filename.lower().endswith('.pdf'):
@@ -117,9 +118,9 @@ async def upload_resume(
             mimetype = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
         
         # Parse resume (skills will be standardized in parser)
-        parsed_data = parser.parse_resume(save_path, mimetype)
+        parsed_data = await parser.parse_resume_async(save_path, mimetype)
         
-        logger.info(f"Resume parsed successfully. Skills: {parsed_data.get('skills', [])}")
+        logger.info("Resume parsed successfully. Skills: %s", parsed_data.get('skills', []))
         
     except FileParseError as e:
         os.remove(save_path)  # Clean up on error
@@ -129,20 +130,23 @@ async def upload_resume(
         )
     except Exception as e:
         os.remove(save_path)  # Clean up on error
-        logger.exception(f"Failed to parse resume: {e}")
+        logger.exception("Failed to parse resume: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to parse resume"
         )
 
     # ===== SAVE TO DATABASE =====
+    # The text has its own column; keep it out of the JSON copy and the response
+    raw_text = parsed_data.get('raw_text')
+    parsed_data = {**parsed_data, 'raw_text': None}
     resume = Resume(
-        id=uuid.uuid4(),
+        id=uuid7(),
         candidate_id=candidate.id,
         filename=filename,
         file_path=save_path,
         parsed_data=parsed_data,
-        raw_text=parsed_data.get('raw_text'),
+        raw_text=raw_text,
         skills=parsed_data.get('skills', []),  # ✅ NOW STANDARDIZED!
         experience_years=parsed_data.get('experience_years'),
         education_level=extract_education_level(parsed_data.get('education', []))
@@ -151,12 +155,12 @@ async def upload_resume(
     await db.commit()
     await db.refresh(resume)
 
-    logger.info(f"Resume saved with ID: {resume.id}, Standardized Skills: {resume.skills}")
+    logger.info("Resume saved with ID: %s, Standardized Skills: %s", resume.id, resume.skills)
 
     # ===== UPSERT EMBEDDING =====
     try:
-        text_for_embed = (parsed_data.get('raw_text') or '') + '\n' + ' '.join(parsed_data.get('skills', []))
-        emb = get_embedding(text_for_embed[:5000])
+        text_for_embed = (raw_text or '') + '\n' + ' '.join(parsed_data.get('skills', []))
+        emb = get_embedding(text_for_embed)
         vector_store.upsert("resumes", [(str(resume.id), emb, {"filename": filename, "candidate_id": str(candidate.id)})])
     except Exception:
         logger.warning("Failed to upsert resume embedding; continuing")
@@ -247,24 +251,24 @@ async def parse_resume(
         )
 
     # Initialize parsers based on request options
-    spacy_parser = ResumeParser()
+    spacy_parser = get_resume_parser()
     parsed = None
     
     # Try RAG if requested and configured
     if parse_options.use_rag and getattr(settings, 'USE_RAG_PARSER', False):
         try:
-            rag_parser = RAGResumeParser()
-            parsed = rag_parser.parse_resume(filepath, mimetype)
+            rag_parser = get_rag_resume_parser()
+            parsed = await rag_parser.aparse_resume(filepath, mimetype)
             logger.info("RAG parser used successfully")
         except Exception as e:
-            logger.warning(f"RAG parser failed: {str(e)}")
+            logger.warning("RAG parser failed: %s", e)
             parsed = None
 
     # Use spaCy parser if RAG failed or not requested
     if not parsed or not parsed.get('skills'):
         try:
-            parsed = spacy_parser.parse_resume(filepath, mimetype)
-            logger.info(f"spaCy parser used. Skills: {parsed.get('skills', [])}")
+            parsed = await spacy_parser.parse_resume_async(filepath, mimetype)
+            logger.info("spaCy parser used. Skills: %s", parsed.get('skills', []))
         except FileParseError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -281,9 +285,9 @@ async def parse_resume(
             parsed['skills'] = spacy_parser.skills_standardizer.standardize_skills(
                 parsed['skills']
             )
-            logger.info(f"Skills standardized: {parsed['skills']}")
+            logger.info("Skills standardized: %s", parsed['skills'])
         except Exception as e:
-            logger.warning(f"Skills standardization failed: {e}")
+            logger.warning("Skills standardization failed: %s", e)
         
     # Enrich parse results if detailed extraction requested
     if parse_options.extract_detailed:
@@ -296,15 +300,20 @@ async def parse_resume(
             if detailed_edu:
                 parsed['education'] = detailed_edu
                 
-            logger.info(f"Detailed extraction completed. Experience: {len(detailed_exp)}, Education: {len(detailed_edu)}")
+            logger.info("Detailed extraction completed. Experience: %s, Education: %s", len(detailed_exp), len(detailed_edu))
         except Exception as e:
-            logger.warning(f"Detailed extraction failed: {str(e)}")
+            logger.warning("Detailed extraction failed: %s", e)
+
+    # The text has its own column; keep it out of the JSON copy, and out of
+    # the response unless asked for
+    raw_text = parsed.get('raw_text')
+    parsed = {**parsed, 'raw_text': None}
 
     # Persist parsed results to DB
     try:
         # Update resume record with parsed data
         resume_record.parsed_data = parsed
-        resume_record.raw_text = parsed.get('raw_text')
+        resume_record.raw_text = raw_text
         
         # Normalize and validate skills
         if isinstance(parsed.get('skills'), list):
@@ -326,19 +335,19 @@ async def parse_resume(
         await db.commit()
         await db.refresh(resume_record)
         
-        logger.info(f"Resume {resume_id} parsed and saved. Skills: {resume_record.skills}")
+        logger.info("Resume %s parsed and saved. Skills: %s", resume_id, resume_record.skills)
 
         # Update embedding after re-parse
         try:
-            text_for_embed = (parsed.get('raw_text') or '') + '\n' + ' '.join(parsed.get('skills', []))
-            emb = get_embedding(text_for_embed[:5000])
+            text_for_embed = (raw_text or '') + '\n' + ' '.join(parsed.get('skills', []))
+            emb = get_embedding(text_for_embed)
             vector_store.upsert("resumes", [(str(resume_record.id), emb, {"filename": resume_record.filename, "candidate_id": str(resume_record.candidate_id)})])
         except Exception:
             logger.warning("Failed to upsert updated resume embedding")
         
     except Exception as e:
         await db.rollback()
-        logger.exception(f"Failed to save parsed resume: {e}")
+        logger.exception("Failed to save parsed resume: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -351,7 +360,7 @@ async def parse_resume(
     # Add confidence score if missing
     if 'confidence_score' not in parsed:
         required_fields = [
-            bool(parsed.get('raw_text')),
+            bool(raw_text),
             bool(parsed.get('skills')),
             bool(parsed.get('experience')),
             bool(parsed.get('education')),
@@ -360,6 +369,8 @@ async def parse_resume(
         ]
         parsed['confidence_score'] = round(sum(1 for f in required_fields if f) / len(required_fields), 2)
 
+    if parse_options.include_raw_text:
+        parsed = {**parsed, 'raw_text': raw_text}
     return ParseResumeResponse(**parsed)
 
 
@@ -536,15 +547,15 @@ async def delete_resume(
     if resume.file_path and os.path.exists(resume.file_path):
         try:
             os.remove(resume.file_path)
-            logger.info(f"Deleted file: {resume.file_path}")
+            logger.info("Deleted file: %s", resume.file_path)
         except Exception as e:
-            logger.warning(f"Failed to delete file: {e}")
+            logger.warning("Failed to delete file: %s", e)
     
     # Delete from DB
     await db.delete(resume)
     await db.commit()
     
-    logger.info(f"Resume deleted: {resume_id}")
+    logger.info("Resume deleted: %s", resume_id)
     
     return {"message": "Resume deleted successfully"}
 
@@ -2,6 +2,8 @@ from fastapi import APIRouter, Header, HTTPException, Depends
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+import asyncio
+import re
 import uuid
 
 from app.core.database import get_db
@@ -10,7 +12,8 @@ from app.models.resume import Resume
 from app.models.jobs import Job
 from app.models.candidate import Candidate
 from app.services.task_queue import task_queue
-from app.services.resumeparser import ResumeParser, FileParseError
+from app.services.embeddings import get_embedding, vector_store
+from app.services.resumeparser import get_resume_parser, FileParseError
 from app.api.v1.matching import (
     calculate_skill_match,
     calculate_experience_score,
@@ -22,6 +25,8 @@ from app.models.screening_results import ScreeningResult
 
 router = APIRouter()
 
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+
 
 def require_auth(authorization: str) -> str:
     if not authorization:
@@ -40,9 +45,7 @@ def require_auth(authorization: str) -> str:
 @router.post("/tasks/parse-resume/{resume_id}")
 async def enqueue_parse_resume(resume_id: str, authorization: str = Header(None)):
     require_auth(authorization)
-    try:
-        uuid.UUID(resume_id)
-    except ValueError:
+    if not _UUID_RE.fullmatch(resume_id):
         raise HTTPException(status_code=400, detail="Invalid resume id")
     task_id = task_queue.enqueue("parse_resume", {"resume_id": resume_id})
     return {"task_id": task_id, "status": "queued"}
@@ -58,9 +61,7 @@ class MatchTask(BaseModel):
 async def enqueue_match(task: MatchTask, authorization: str = Header(None)):
     require_auth(authorization)
     for fid in (task.job_id, task.candidate_id, task.resume_id):
-        try:
-            uuid.UUID(fid)
-        except ValueError:
+        if not _UUID_RE.fullmatch(fid):
             raise HTTPException(status_code=400, detail="Invalid id format")
     task_id = task_queue.enqueue("match_candidate", task.model_dump())
     return {"task_id": task_id, "status": "queued"}
@@ -75,19 +76,17 @@ async def get_task_status(task_id: str, authorization: str = Header(None)):
     return status
 
 
-# Register handlers once (import side-effect in main lifespan)
+# Register handlers once (called from main lifespan, not at import time)
 def _register_handlers():
-    from app.services.embeddings import get_embedding, vector_store
     from app.core.database import async_session
 
     async def handle_parse(payload):
         rid = uuid.UUID(payload["resume_id"])
         async with async_session() as session:
-            res = await session.execute(select(Resume).where(Resume.id == rid))
-            resume = res.scalars().first()
+            resume = await session.get(Resume, rid)
             if not resume:
                 raise RuntimeError("Resume not found")
-            parser = ResumeParser()
+            parser = get_resume_parser()
             # Detect mimetype by filename
             fname = (resume.filename or "").lower()
             if fname.endswith('.pdf'):
@@ -96,32 +95,41 @@ def _register_handlers():
                 mimetype = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
             else:
                 mimetype = 'application/octet-stream'
-            parsed = parser.parse_resume(resume.file_path, mimetype)
-            resume.parsed_data = parsed
+            # PDF/NLP parsing is CPU-bound; keep it off the event loop
+            parsed = await parser.parse_resume_async(resume.file_path, mimetype)
+            # The text has its own column; keep it out of the JSON copy
             resume.raw_text = parsed.get('raw_text')
+            resume.parsed_data = {**parsed, 'raw_text': None}
             resume.skills = parsed.get('skills') or []
             resume.experience_years = parsed.get('experience_years')
             # Simple education level extraction
             edu = parsed.get('education') or []
             resume.education_level = (edu[0].get('degree') if edu and isinstance(edu[0], dict) else None)
-            session.add(resume)
-            await session.commit()
-            # Update embedding
             emb_text = (resume.raw_text or '') + '\n' + ' '.join(resume.skills or [])
-            vec = get_embedding(emb_text[:5000])
-            vector_store.upsert("resumes", [(str(resume.id), vec, {"filename": resume.filename, "candidate_id": str(resume.candidate_id)})])
+            # Read before committing: the commit expires the ORM attributes
+            resume_id = str(resume.id)
+            meta = {"filename": resume.filename, "candidate_id": str(resume.candidate_id)}
+
+            async def _commit():
+                session.add(resume)
+                await session.commit()
+
+            # Embed while the commit runs, but only index the resume once it is stored
+            _, vec = await asyncio.gather(_commit(), asyncio.to_thread(get_embedding, emb_text))
+            await asyncio.to_thread(vector_store.upsert, "resumes", [(resume_id, vec, meta)])
 
     async def handle_match(payload):
         jid = uuid.UUID(payload['job_id'])
         cid = uuid.UUID(payload['candidate_id'])
         rid = uuid.UUID(payload['resume_id'])
         async with async_session() as session:
-            jres = await session.execute(select(Job).where(Job.id == jid))
-            job = jres.scalars().first()
-            rres = await session.execute(select(Resume).where(Resume.id == rid))
-            resume = rres.scalars().first()
-            if not job or not resume:
+            # One round-trip for both rows instead of two sequential lookups
+            row = (await session.execute(
+                select(Job, Resume).where(Job.id == jid, Resume.id == rid)
+            )).first()
+            if not row:
                 raise RuntimeError("Job or Resume not found")
+            job, resume = row
             skill = calculate_skill_match(job.requirements, resume.skills or [])
             exp = calculate_experience_score(job.requirements, resume.experience_years)
             edu = calculate_education_score(resume.education_level)
@@ -148,6 +156,3 @@ def _register_handlers():
     task_queue.register_handler("match_candidate", handle_match)
 
 
-_register_handlers()
-
-
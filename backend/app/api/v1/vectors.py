@@ -3,7 +3,7 @@ from pydantic import BaseModel
 from typing import List, Dict, Optional
 
 from app.core.security import decode_token
-from app.services.embeddings import get_embedding, vector_store
+from app.services.embeddings import get_embedding, get_embeddings, vector_store
 
 
 router = APIRouter()
@@ -37,11 +37,13 @@ class UpsertRequest(BaseModel):
 @router.post("/vectors/upsert")
 def upsert_vectors(payload: UpsertRequest, authorization: str = Header(None)):
     require_auth(authorization)
-    vectors = []
-    for it in payload.items:
-        emb = get_embedding(it.text[:5000])
-        vectors.append((it.id, emb, it.metadata))
-    vector_store.upsert(payload.namespace, vectors)
+    embs = get_embeddings([it.text for it in payload.items])
+    vectors = [(it.id, emb, it.metadata) for it, emb in zip(payload.items, embs)]
+    try:
+        vector_store.upsert(payload.namespace, vectors)
+    except ValueError as e:
+        # e.g. a hashing-fallback vector headed for a namespace of OpenAI ones
+        raise HTTPException(status_code=422, detail=str(e))
     return {"success": True, "upserted": len(vectors)}
 
 
@@ -55,7 +57,7 @@ class QueryRequest(BaseModel):
 @router.post("/vectors/query")
 def query_vectors(payload: QueryRequest, authorization: str = Header(None)):
     require_auth(authorization)
-    emb = get_embedding(payload.text[:5000])
+    emb = get_embedding(payload.text)
     results = vector_store.query(payload.namespace, emb, top_k=payload.top_k, filter=payload.filter)
     return {"results": results}
 
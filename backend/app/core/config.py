@@ -2,13 +2,29 @@ from pydantic_settings import BaseSettings
 from typing import Optional
 
 class Settings(BaseSettings):
+    # 'dev' | 'test' create tables at startup; any other value leaves the
+    # schema to migrations
+    APP_ENV: str = "dev"
+
     # Secrets (optional in local dev)
     OPENAI_API_KEY: Optional[str] = None
     SECRET_KEY: Optional[str] = None
     DATABASE_URL: Optional[str] = None
 
+    # Database connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
+
+    # Resume parsing: load the spaCy NER model on the GPU (needs cupy/torch with CUDA)
+    SPACY_USE_GPU: bool = False
+    # Prefer the transformer NER model over the small one (slower, more accurate)
+    SPACY_HIGH_ACCURACY: bool = False
+
     # Vector DB selection: 'inmemory' | 'pinecone' | 'qdrant'
     VECTOR_BACKEND: str = "inmemory"
+    # In-memory backend: store vectors as int8 (4x less memory, ~1e-3 score error)
+    VECTOR_QUANTIZE_INT8: bool = False
 
     # Pinecone
     PINECONE_API_KEY: Optional[str] = None
@@ -1,6 +1,8 @@
-from sqlalchemy import create_engine
+import asyncio
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 
 from app.core.config import settings
@@ -11,7 +13,21 @@ Base = declarative_base()
 engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     echo=False,
-    future=True
+    future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Reuse the most recently returned connection so idle ones can time out
+    # while hot ones stay warm
+    pool_use_lifo=True,
+    connect_args={
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 256,
+        # Short OLTP queries never amortise PostgreSQL's JIT compile step
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Async session
@@ -26,3 +42,14 @@ async_session = sessionmaker(
 async def get_db():
     async with async_session() as session:
         yield session
+
+
+async def warm_pool(size: int = settings.DB_POOL_SIZE) -> None:
+    """Open `size` pooled connections up front so early requests skip the connect cost."""
+    async def _open():
+        return await engine.connect()
+
+    conns = await asyncio.gather(*(_open() for _ in range(size)), return_exceptions=True)
+    for conn in conns:
+        if not isinstance(conn, BaseException):
+            await conn.close()
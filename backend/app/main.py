@@ -1,33 +1,33 @@
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import ORJSONResponse, Response
 from contextlib import asynccontextmanager
-from datetime import datetime
+import asyncio
 import logging
-import uuid
+import time
 
 # API routers
 from app.api.v1 import auth, resumes, candidates, jobs, matching, health, analytics, vectors, tasks, admin
 from app.api.v1.skills import router as skills_router
 
 # Core modules
-from app.core.database import engine, Base, async_session
-from app.core.middleware import (
-    global_error_handler, 
-    request_context_middleware, 
-    rate_limit_middleware, 
-    security_headers_middleware
-)
-from app.core.metrics import record_request, export_prometheus
+from app.core.database import engine, Base, async_session, warm_pool
+from app.core.middleware import CombinedMiddleware
+from app.core.metrics import export_prometheus
 from app.core.security import get_password_hash
+from app.core.ids import uuid7
+from app.core.config import settings
 
-# Models & Exceptions
+# Models
 from app.models.users import User
-from app.services.resumeparser import FileParseError
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 logger = logging.getLogger(__name__)
 
+# Arbitrary advisory lock key shared by workers running startup DDL
+SCHEMA_LOCK_KEY = 0x48495245
+
 
 # ========== STARTUP & SHUTDOWN ==========
 
@@ -35,41 +35,61 @@ async def create_superuser_admin():
     """Create superuser admin on startup if it doesn't exist"""
     try:
         async with async_session() as session:
+            # Existence check only needs the id, not a hydrated User
             result = await session.execute(
-                select(User).where(User.email == 'admin@hireassist.com')
+                select(User.id).where(User.email == 'admin@hireassist.com').limit(1)
             )
-            existing_admin = result.scalars().first()
-            
-            if existing_admin:
+            if result.scalar() is not None:
                 logger.info("✅ Superuser admin already exists")
                 return
             
-            admin_user = User(
-                id=uuid.uuid4(),
-                email='admin@hireassist.com',
-                password_hash=get_password_hash('AdminPassword123!'),
-                first_name='Admin',
-                last_name='User',
-                role='admin',
-                is_approved=True,
-                created_at=datetime.utcnow()
-            )
+            # bcrypt is deliberately slow; keep it off the event loop
+            password_hash = await asyncio.to_thread(get_password_hash, 'AdminPassword123!')
             
-            session.add(admin_user)
+            # ON CONFLICT covers another worker creating the admin in between
+            result = await session.execute(
+                pg_insert(User)
+                .values(
+                    id=uuid7(),
+                    email='admin@hireassist.com',
+                    password_hash=password_hash,
+                    first_name='Admin',
+                    last_name='User',
+                    role='admin',
+                    is_approved=True
+                )
+                .on_conflict_do_nothing(index_elements=[User.email])
+                .returning(User.id)
+            )
+            created = result.scalar() is not None
             await session.commit()
+            if not created:
+                logger.info("✅ Superuser admin already exists")
+                return
             
-            logger.info("=" * 60)
-            logger.info("✅ SUPERUSER ADMIN CREATED SUCCESSFULLY!")
-            logger.info("=" * 60)
-            logger.info("📋 Admin Credentials:")
-            logger.info("   Email: admin@hireassist.com")
-            logger.info("   Password: AdminPassword123!")
-            logger.info("=" * 60)
-            logger.info("⚠️  IMPORTANT: Change password after first login!")
-            logger.info("=" * 60)
+            logger.info(
+                "✅ Superuser admin created: %s (change the default password after first login)",
+                'admin@hireassist.com'
+            )
             
     except Exception as e:
-        logger.error(f"❌ Error creating superuser admin: {str(e)}")
+        logger.error("❌ Error creating superuser admin: %s", e)
+
+
+async def start_task_queue():
+    """Register task handlers and start the in-process worker"""
+    try:
+        from app.services.task_queue import task_queue
+        tasks._register_handlers()
+        await task_queue.start()
+        logger.info("✅ Task queue worker started")
+    except Exception as e:
+        logger.warning("⚠️ Task queue not started: %s", e)
+
+
+async def warm_password_hasher():
+    """Load the bcrypt backend now so the first login doesn't pay for it"""
+    await asyncio.to_thread(get_password_hash, "warmup")
 
 
 @asynccontextmanager
@@ -77,18 +97,28 @@ async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     logger.info("🚀 Starting HireAssist API...")
     
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("✅ Database tables created/verified")
-    
-    await create_superuser_admin()
+    if settings.APP_ENV in ("dev", "test"):
+        async with engine.begin() as conn:
+            # One worker at a time; the lock is released when the transaction commits
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY}
+            )
+            await conn.run_sync(Base.metadata.create_all)
+        logger.info("✅ Database tables created/verified")
+    else:
+        logger.info("Skipping table creation (APP_ENV=%s)", settings.APP_ENV)
     
-    try:
-        from app.services.task_queue import task_queue
-        await task_queue.start()
-        logger.info("✅ Task queue worker started")
-    except Exception as e:
-        logger.warning(f"⚠️ Task queue not started: {e}")
+    # Admin bootstrap, task queue start and warm-ups are independent
+    steps = {
+        "create_superuser_admin": create_superuser_admin(),
+        "start_task_queue": start_task_queue(),
+        "warm_pool": warm_pool(),
+        "warm_password_hasher": warm_password_hasher(),
+    }
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    for step, result in zip(steps, results):
+        if isinstance(result, BaseException):
+            logger.error("❌ Startup step %s failed: %s", step, result)
 
     logger.info("✅ HireAssist API started successfully!")
     
@@ -105,6 +135,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -122,47 +153,20 @@ app.add_middleware(
         "http://127.0.0.1:3000"
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists keep preflight responses constant so browsers can cache them
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
+    max_age=86400,
 )
 
-# Error handling middleware
-@app.middleware("http")
-async def error_handling_middleware(request: Request, call_next):
-    return await global_error_handler(request, call_next)
-
-# Request context middleware
-@app.middleware("http")
-async def add_request_context(request: Request, call_next):
-    return await request_context_middleware(request, call_next)
-
-# Rate limiting middleware
-@app.middleware("http")
-async def apply_rate_limit(request: Request, call_next):
-    return await rate_limit_middleware(request, call_next)
-
-# Security headers middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    return await security_headers_middleware(request, call_next)
-
-# Metrics middleware
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    start = datetime.utcnow()
-    response = await call_next(request)
-    duration_ms = int((datetime.utcnow() - start).total_seconds() * 1000)
-    try:
-        record_request(request.url.path, response.status_code, duration_ms)
-    except Exception as e:
-        logger.warning(f"Metrics recording failed: {e}")
-    return response
+# Error handling, request context, rate limiting, security headers and metrics
+app.add_middleware(CombinedMiddleware)
 
 
 # ========== ROOT ENDPOINT ==========
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint"""
     return {
         "message": "HireAssist Backend is running!",
@@ -192,31 +196,32 @@ app.include_router(tasks.router, prefix="/api/v1", tags=["tasks"])
 
 # ========== METRICS ENDPOINT ==========
 
+# Scrapes within the TTL reuse the last encoded body
+METRICS_CACHE_TTL = 1.0
+_metrics_cache = {"ts": 0.0, "body": b""}
+_metrics_lock = asyncio.Lock()
+
+
 @app.get("/api/v1/metrics")
-def prometheus_metrics():
+async def prometheus_metrics():
     """Export Prometheus metrics"""
+    if time.monotonic() - _metrics_cache["ts"] > METRICS_CACHE_TTL:
+        async with _metrics_lock:
+            now = time.monotonic()
+            # Re-check: a concurrent scrape may have refreshed it while we waited
+            if now - _metrics_cache["ts"] > METRICS_CACHE_TTL:
+                _metrics_cache["body"] = export_prometheus().encode("utf-8")
+                _metrics_cache["ts"] = now
     return Response(
-        content=export_prometheus(),
+        content=_metrics_cache["body"],
         media_type="text/plain; version=0.0.4"
     )
 
 
-# ========== EXCEPTION HANDLERS ==========
-
-@app.exception_handler(FileParseError)
-async def file_parse_error_handler(request: Request, exc: FileParseError):
-    """Handle resume parsing errors"""
-    logger.exception("FileParseError: %s", exc)
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content={"detail": str(exc)}
-    )
-
-
 # ========== TEST ENDPOINTS ==========
 
 @app.get("/api/v1/test-error")
-def test_error():
+async def test_error():
     """Test endpoint for error handling verification"""
     raise Exception("Test induced error")
 
@@ -1,14 +1,21 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
 import uuid
+from datetime import datetime
+from sqlalchemy import String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.core.ids import uuid7
 
 class Application(Base):
     __tablename__ = "applications"
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"))
-    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidates.id"))
-    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id"))
-    status = Column(String(50), server_default="submitted")
-    applied_at = Column(DateTime, server_default=func.now())
+    __table_args__ = (
+        # Also serves plain job_id lookups
+        Index("ix_applications_job_status", "job_id", "status"),
+    )
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    job_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("jobs.id"))
+    candidate_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("candidates.id"), index=True)
+    resume_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("resumes.id"), index=True)
+    status: Mapped[str | None] = mapped_column(String(50), server_default="submitted")
+    applied_at: Mapped[datetime | None] = mapped_column(DateTime, server_default=func.now())
@@ -1,25 +1,32 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, ARRAY, TEXT, INT4RANGE
 import uuid
+from datetime import datetime
+from sqlalchemy import String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, INT4RANGE, Range
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Covers listing jobs by status, newest first
+        Index("ix_jobs_status_created", "status", "created_at"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), nullable=True)
-    title = Column(String(255), nullable=False)
-    description = Column(Text, nullable=False)
-    requirements = Column(Text)
-    location = Column(String(255))
-    salary_range = Column(INT4RANGE)
-    status = Column(String(50), server_default="active")
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    organization_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True, index=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    requirements: Mapped[str | None] = mapped_column(Text)
+    location: Mapped[str | None] = mapped_column(String(255))
+    salary_range: Mapped[Range[int] | None] = mapped_column(INT4RANGE)
+    status: Mapped[str | None] = mapped_column(String(50), server_default="active")
     # embedding field removed - will add later with pgvector setup
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+    created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"))
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
     
     def __repr__(self):
         return f"<Job(id={self.id}, title={self.title})>"
@@ -1,28 +1,36 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text
+import uuid
+from datetime import datetime
+from typing import Any
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-import uuid
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Serves candidate_id lookups and "latest resume(s) for a candidate"
+        Index("ix_resumes_candidate_created", "candidate_id", "created_at"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidates.id"), nullable=False)
-    filename = Column(String(255), nullable=False)
-    file_path = Column(String(500), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    candidate_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("candidates.id"), nullable=False)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     
     # Parsed resume data
-    parsed_data = Column(JSONB, nullable=True)
-    raw_text = Column(Text, nullable=True)
-    skills = Column(ARRAY(Text), nullable=True)  # Native PostgreSQL array
-    experience_years = Column(Integer, nullable=True)
-    education_level = Column(String(100), nullable=True)
+    parsed_data: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    raw_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    skills: Mapped[list[str] | None] = mapped_column(ARRAY(Text), nullable=True)  # Native PostgreSQL array
+    experience_years: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    education_level: Mapped[str | None] = mapped_column(String(100), nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
     
     def __repr__(self):
         return f"<Resume(id={self.id}, filename={self.filename})>"
@@ -1,16 +1,21 @@
-from sqlalchemy import Column, Numeric, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from sqlalchemy import Numeric, DateTime
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.core.ids import uuid7
 
 class ScreeningResult(Base):
     __tablename__ = "screening_results"
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    application_id = Column(UUID(as_uuid=True),  nullable=True)
-    overall_score = Column(Numeric(5, 2))
-    skill_match_score = Column(Numeric(5, 2))
-    experience_score = Column(Numeric(5, 2))
-    education_score = Column(Numeric(5, 2))
-    detailed_analysis = Column(JSONB)
-    created_at = Column(DateTime, server_default=func.now())
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    application_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True, index=True)
+    overall_score: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+    skill_match_score: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+    experience_score: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+    education_score: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+    detailed_analysis: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
+    created_at: Mapped[datetime | None] = mapped_column(DateTime, server_default=func.now())
@@ -1,13 +1,16 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
 import enum
+import uuid
+from datetime import datetime
+from sqlalchemy import String, Boolean, DateTime, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class UserRole(str, enum.Enum):
-    """User role enumeration"""
+    """User role enumeration (stored as its string value)"""
     ADMIN = "admin"
     RECRUITER = "recruiter"
     CANDIDATE = "candidate"
@@ -15,46 +18,51 @@ class UserRole(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Plain string + CHECK instead of a native ENUM type: no type OID to
+        # resolve on reads and no ALTER TYPE to add a role
+        CheckConstraint("role IN ('admin','recruiter','candidate')", name="ck_users_role"),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # Authentication
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     
     # Profile
-    first_name = Column(String(100), nullable=True)
-    last_name = Column(String(100), nullable=True)
+    first_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    last_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     
     # Role & Status
-    role = Column(Enum(UserRole), nullable=False, default=UserRole.CANDIDATE)
-    is_active = Column(Boolean, default=True, nullable=False)
-    is_verified = Column(Boolean, default=False, nullable=False)
+    role: Mapped[str] = mapped_column(String(20), nullable=False, default=UserRole.CANDIDATE.value)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Approval System
-    is_approved = Column(Boolean, default=False, nullable=False)
+    is_approved: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), nullable=False)
-    approved_at = Column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), nullable=False)
+    approved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role}, approved={self.is_approved})>"
     
     def is_admin(self) -> bool:
         """Check if user is admin"""
-        return self.role == UserRole.ADMIN
+        return self.role == UserRole.ADMIN.value
     
     def is_candidate(self) -> bool:
         """Check if user is candidate"""
-        return self.role == UserRole.CANDIDATE
+        return self.role == UserRole.CANDIDATE.value
     
     def is_recruiter(self) -> bool:
         """Check if user is recruiter"""
-        return self.role == UserRole.RECRUITER
+        return self.role == UserRole.RECRUITER.value
     
     def can_login(self) -> bool:
         """Check if user can login (approved & active)"""
-        return self.is_active and (self.is_approved or self.role == UserRole.ADMIN)
+        return self.is_active and (self.is_approved or self.role == UserRole.ADMIN.value)
@@ -30,6 +30,7 @@ class ParseResumeRequest(BaseModel):
     """Optional parameters for resume parsing."""
     use_rag: bool = Field(False, description="Whether to use RAG/LLM parser")
     extract_detailed: bool = Field(False, description="Whether to extract detailed sections")
+    include_raw_text: bool = Field(False, description="Whether to return the extracted text in the response")
 
 
 class ParseResumeResponse(BaseModel):
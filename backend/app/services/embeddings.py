@@ -1,44 +1,191 @@
 from __future__ import annotations
 
 import hashlib
-import math
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional
 
+import numpy as np
+import xxhash
+
 from app.core.config import settings
 from app.services.vector_search import get_vector_store
 
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+# text-embedding-3-small accepts 8191 tokens; keep a little headroom
+MAX_EMBEDDING_TOKENS = 8000
+# The hashing fallback has no token limit; cap it as callers used to
+MAX_HASHING_CHARS = 5000
+# The embeddings endpoint accepts up to 2048 inputs per request
+EMBEDDING_BATCH_SIZE = 2048
+EMBEDDING_CACHE_SIZE = 4096
+# Width of the hashing fallback vectors
+HASHING_DIM = 256
+
+# sha1(truncated text) -> embedding, least recently used first
+_embedding_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_tokenizer():
+    try:
+        import tiktoken  # type: ignore
+    except Exception:
+        return None
+    try:
+        # Downloads the BPE file on first use; failing here (e.g. offline) is
+        # cached as None so later calls don't retry the download
+        return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+    except Exception as e:
+        logger.warning("tiktoken encoding unavailable, truncating by characters: %s", e)
+        return None
+
+
+def _truncate_tokens(text: str) -> str:
+    """Trim text to the model's token budget so the API never truncates server-side."""
+    enc = _get_tokenizer()
+    if enc is None:
+        # Roughly four characters per token for English text
+        return text[: MAX_EMBEDDING_TOKENS * 4]
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= MAX_EMBEDDING_TOKENS:
+        return text
+    return enc.decode(tokens[:MAX_EMBEDDING_TOKENS])
 
-def _hashing_embedding(text: str, dim: int = 256) -> List[float]:
+
+def _hash_token(tok: str) -> int:
+    """Non-cryptographic 64-bit token hash (xxh64)."""
+    return xxhash.xxh64_intdigest(tok.encode("utf-8"))
+
+
+def _hashing_embedding(text: str, dim: int = HASHING_DIM) -> List[float]:
     """Deterministic, fast fallback embedding using hashing buckets."""
-    vector = [0.0] * dim
-    if not text:
-        return vector
-    tokens = text.lower().split()
-    for tok in tokens:
-        h = int(hashlib.sha256(tok.encode("utf-8")).hexdigest(), 16)
-        idx = h % dim
-        vector[idx] += 1.0
-    # L2 normalize
-    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
-    return [v / norm for v in vector]
+    return hashing_embeddings([text], dim)[0].tolist()
 
 
-def get_embedding(text: str) -> List[float]:
-    """Return embedding for text using OpenAI if configured, else hashing fallback."""
+def hashing_embeddings(texts: List[str], dim: int = HASHING_DIM) -> np.ndarray:
+    """Hashing fallback embeddings: an (N, dim) float32 matrix of L2-normalised rows.
+
+    All (row, bucket) hits are counted with one bincount over flat indices and
+    the rows normalised together, instead of one vector per text.
+    """
+    token_lists = [t.lower().split() if t else [] for t in texts]
+    counts = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+    total = int(counts.sum())
+    rows = np.repeat(np.arange(len(token_lists), dtype=np.int64), counts)
+    cols = np.fromiter(
+        (_hash_token(tok) % dim for tokens in token_lists for tok in tokens), dtype=np.int64, count=total
+    )
+    mat = np.bincount(rows * dim + cols, minlength=len(token_lists) * dim).astype(np.float32)
+    mat = mat.reshape(len(token_lists), dim)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    mat /= norms
+    return mat
+
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Shared OpenAI client, or None when no key is configured or the SDK is missing."""
+    api_key = getattr(settings, "OPENAI_API_KEY", None)
+    if not api_key:
+        return None
+    # Lazy import to avoid hard dependency
     try:
-        api_key = getattr(settings, "OPENAI_API_KEY", None)
-        if api_key:
-            # Lazy import to avoid hard dependency
-            try:
-                from openai import OpenAI  # type: ignore
-            except Exception:
-                return _hashing_embedding(text)
-            client = OpenAI(api_key=api_key)
-            resp = client.embeddings.create(model="text-embedding-3-small", input=text or "")
-            return list(resp.data[0].embedding)
-        return _hashing_embedding(text)
+        from openai import OpenAI  # type: ignore
     except Exception:
-        return _hashing_embedding(text)
+        return None
+    return OpenAI(api_key=api_key)
+
+
+def _create_embeddings(client, texts: List[str]) -> List[Optional[tuple]]:
+    """One embeddings request; None in place of each text the API would not embed.
+
+    A 400 means some input was rejected, so the batch is split to isolate it.
+    Anything else has already been retried by the client and fails the batch.
+    """
+    try:
+        resp = client.embeddings.create(model=EMBEDDING_MODEL, input=texts)
+    except Exception as e:
+        if getattr(e, "status_code", None) == 400 and len(texts) > 1:
+            mid = len(texts) // 2
+            return _create_embeddings(client, texts[:mid]) + _create_embeddings(client, texts[mid:])
+        logger.warning("OpenAI embedding failed for %d text(s); using hashing fallback", len(texts), exc_info=True)
+        return [None] * len(texts)
+    return [tuple(item.embedding) for item in sorted(resp.data, key=lambda d: d.index)]
+
+
+def _embed_with_openai(client, texts: List[str]) -> List[List[float]]:
+    inputs = [_truncate_tokens(t) for t in texts]
+    keys = [hashlib.sha1(t.encode("utf-8")).digest() for t in inputs]
+
+    found = {}
+    missing = {}
+    with _embedding_cache_lock:
+        for key, text in zip(keys, inputs):
+            hit = _embedding_cache.get(key)
+            if hit is not None:
+                _embedding_cache.move_to_end(key)
+                found[key] = hit
+            else:
+                missing[key] = text
+
+    pending = list(missing.items())
+    embedded = []
+    failed = []
+    for start in range(0, len(pending), EMBEDDING_BATCH_SIZE):
+        chunk = pending[start:start + EMBEDDING_BATCH_SIZE]
+        for (key, text), vec in zip(chunk, _create_embeddings(client, [t for _, t in chunk])):
+            if vec is None:
+                failed.append((key, text))
+            else:
+                found[key] = vec
+                embedded.append(key)
+
+    if failed:
+        # Only the texts the API didn't embed get the fallback, and it isn't cached
+        fallback = hashing_embeddings([t[:MAX_HASHING_CHARS] for _, t in failed])
+        for (key, _), vec in zip(failed, fallback):
+            found[key] = tuple(vec.tolist())
+
+    if embedded:
+        with _embedding_cache_lock:
+            for key in embedded:
+                _embedding_cache[key] = found[key]
+            while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
+
+    return [list(found[key]) for key in keys]
+
+
+def get_embeddings(texts: List[str]) -> List[List[float]]:
+    """Embed several texts, in input order.
+
+    With OpenAI configured, repeated texts are served from an LRU cache and the
+    rest go out in as few requests as possible; texts the API fails to embed
+    get the hashing fallback. Without OpenAI every text does.
+    """
+    texts = [t or "" for t in texts]
+    try:
+        client = _get_client()
+        if client is not None:
+            return _embed_with_openai(client, texts)
+    except Exception:
+        logger.warning("OpenAI embedding failed; using hashing fallback", exc_info=True)
+    return hashing_embeddings([t[:MAX_HASHING_CHARS] for t in texts]).tolist()
+
+
+def get_embedding(text: str) -> List[float]:
+    """Return embedding for text using OpenAI if configured, else hashing fallback.
+
+    Input is truncated here (by tokens for OpenAI), so callers pass full text.
+    """
+    return get_embeddings([text])[0]
 
 
 # Module-level vector store singleton (respects settings.VECTOR_BACKEND)
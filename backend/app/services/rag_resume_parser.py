@@ -1,20 +1,110 @@
 import PyPDF2
 from docx import Document
-from typing import Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import copy
+import hashlib
+import inspect
 import json
+import re
+import threading
 import time
 import logging
 
 from app.core.config import settings
 
+try:
+    import pymupdf
+except Exception:
+    pymupdf = None
+
 logger = logging.getLogger(__name__)
 
+# Headings that open the sections sent to the LLM one at a time
+_SECTION_HEADINGS = {
+    "skills": r"(?:technical\s+)?skills|core\s+competencies|technologies",
+    "education": r"education|academic\s+background",
+    "experience": r"(?:work\s+|professional\s+)?experience|employment(?:\s+history)?|work\s+history",
+}
+# Other headings only end the preceding section
+_OTHER_HEADINGS = r"summary|profile|objective|projects|certifications?|awards|languages|interests|references"
+
+
+def _heading_re(alternatives: str) -> "re.Pattern[str]":
+    return re.compile(rf"^[ \t]*(?:{alternatives})[ \t]*:?[ \t]*$", re.IGNORECASE | re.MULTILINE)
+
+
+_SECTION_HEADING_RES = {name: _heading_re(alts) for name, alts in _SECTION_HEADINGS.items()}
+_ANY_HEADING_RE = _heading_re("|".join([*_SECTION_HEADINGS.values(), _OTHER_HEADINGS]))
+
+# Contact details live in the header above the first section
+_CONTACT_SNIPPET_CHARS = 1000
+
+# What each section prompt asks for, and the JSON shape it should return
+_SECTION_FIELDS = {
+    "contact": ("contact_info (email, phone)", '{"contact_info": {"email": ..., "phone": ...}}'),
+    "skills": ("skills (as a list)", '{"skills": [...]}'),
+    "education": ("education (as a list)", '{"education": [...]}'),
+    "experience": ("experience (as a list with company, title, dates)", '{"experience": [...]}'),
+}
+
+# LLM responses per section, keyed on sha1 of the section name and snippet
+RAG_CACHE_SIZE = 2048
+_section_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_section_cache_lock = threading.Lock()
+
+
+def _extract_section_snippet(text: str, heading_re: "re.Pattern[str]") -> str:
+    """Return the text between the heading matched by `heading_re` and the next heading."""
+    match = heading_re.search(text)
+    if not match:
+        return ""
+    following = _ANY_HEADING_RE.search(text, match.end())
+    return text[match.end():following.start() if following else len(text)].strip()
+
+
+def _section_snippets(text: str) -> List[Tuple[str, str]]:
+    """Split resume text into (section, snippet) pairs; empty unless every section is found."""
+    first = _ANY_HEADING_RE.search(text)
+    if not first:
+        return []
+    sections = [("contact", text[:min(first.start(), _CONTACT_SNIPPET_CHARS)].strip())]
+    sections.extend(
+        (name, _extract_section_snippet(text, heading_re))
+        for name, heading_re in _SECTION_HEADING_RES.items()
+    )
+    # Merging only the sections found would pass for a full parse
+    if not all(snippet for _, snippet in sections):
+        return []
+    return sections
+
+
+async def _maybe_await(value):
+    return await value if inspect.isawaitable(value) else value
+
+
+def _run_sync(coro):
+    """Run a coroutine that never suspends (all its callables are sync) to completion."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("coroutine suspended; use await instead")
+
+
+def _section_key(name: str, snippet: str) -> bytes:
+    return hashlib.sha1(f"{name}\0{snippet}".encode("utf-8")).digest()
+
 
 class RAGResumeParser:
     def __init__(self):
         # Defer LLM/chain creation until needed and ensure API key present
         self.llm = None
         self.chain = None
+        self.section_chain = None
         self._ensure_llm()
 
     def _ensure_llm(self):
@@ -48,21 +138,39 @@ class RAGResumeParser:
             )
         )
 
+        # One small prompt per section, sent only that section's snippet
+        self.section_prompt = PromptTemplate(
+            input_variables=["fields", "json_format", "snippet"],
+            template=(
+                "Given the following resume section, extract and output a valid compact JSON including:"
+                "\n- {fields}"
+                "\nSection:\n{snippet}\n"
+                "Format output JSON as:"
+                "{json_format}"
+            )
+        )
+
         try:
             self.chain = self.prompt | self.llm | StrOutputParser()
+            self.section_chain = self.section_prompt | self.llm | StrOutputParser()
         except Exception:
             # If chain composition fails, leave chain as None
             logger.exception("Failed to build RAG chain")
+            self.chain = None
 
     def extract_text_from_pdf(self, filepath: str) -> str:
-        text = ""
+        if pymupdf is not None:
+            try:
+                with pymupdf.open(filepath) as doc:
+                    # Encrypted files go to PyPDF2, which raises as before
+                    if not doc.needs_pass:
+                        return "\n".join(page.get_text("text") for page in doc)
+            except Exception as e:
+                logger.warning("PyMuPDF extraction failed for %s, falling back to PyPDF2: %s", filepath, e)
+
         with open(filepath, "rb") as file:
             pdfreader = PyPDF2.PdfReader(file)
-            for page in pdfreader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text
-        return text
+            return "".join(page.extract_text() or "" for page in pdfreader.pages)
 
     def extract_text_from_docx(self, filepath: str) -> str:
         doc = Document(filepath)
@@ -76,24 +184,96 @@ class RAGResumeParser:
         else:
             raise ValueError(f"Unsupported file type: {mimetype}")
 
-    def parse_resume(self, filepath: str, mimetype: str) -> Dict[str, Any]:
-        resume_text = self.extract_text_from_file(filepath, mimetype)
+    @staticmethod
+    def _cached_sections(sections: List[Tuple[str, str]]) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+        """Merge cached section results; return them with the sections still to send."""
+        merged: Dict[str, Any] = {}
+        missing = []
+        with _section_cache_lock:
+            for name, snippet in sections:
+                key = _section_key(name, snippet)
+                cached = _section_cache.get(key)
+                if cached is None:
+                    missing.append((name, snippet))
+                else:
+                    _section_cache.move_to_end(key)
+                    # Callers edit results in place; don't hand out the cached objects
+                    merged.update(copy.deepcopy(cached))
+        return merged, missing
 
-        # If no LLM available, return raw_text only and mark raw_output
-        if not self.chain:
-            logger.info("RAG chain not available; returning raw text only")
-            return {"raw_text": resume_text, "raw_output": None}
+    @staticmethod
+    def _section_input(name: str, snippet: str) -> Dict[str, str]:
+        fields, json_format = _SECTION_FIELDS[name]
+        return {"fields": fields, "json_format": json_format, "snippet": snippet}
+
+    @staticmethod
+    def _store_sections(missing: List[Tuple[str, str]], outputs: List[str], merged: Dict[str, Any]) -> bool:
+        """Merge fresh LLM outputs into `merged` and cache the ones that parsed.
+
+        Returns False if any section's output was not a JSON object.
+        """
+        complete = True
+        for (name, snippet), output in zip(missing, outputs):
+            try:
+                data = json.loads(output)
+            except Exception:
+                data = None
+            if not isinstance(data, dict):
+                logger.warning("RAG section %s returned invalid JSON", name)
+                complete = False
+                continue
+            merged.update(data)
+            with _section_cache_lock:
+                _section_cache[_section_key(name, snippet)] = copy.deepcopy(data)
+                while len(_section_cache) > RAG_CACHE_SIZE:
+                    _section_cache.popitem(last=False)
+        return complete
+
+    def _parse_sections(self, resume_text: str) -> Optional[Dict[str, Any]]:
+        """Prompt per section in parallel; None when the text has no recognisable headings."""
+        sections = _section_snippets(resume_text)
+        if not sections or not self.section_chain:
+            return None
+        merged, missing = self._cached_sections(sections)
+        if missing:
+            outputs = self.section_chain.batch([self._section_input(*section) for section in missing])
+            if not self._store_sections(missing, outputs, merged):
+                # A partial result would pass for a full parse; use the whole-resume prompt
+                return None
+        return merged
+
+    async def _aparse_sections(self, resume_text: str) -> Optional[Dict[str, Any]]:
+        sections = _section_snippets(resume_text)
+        if not sections or not self.section_chain:
+            return None
+        merged, missing = self._cached_sections(sections)
+        if missing:
+            outputs = await asyncio.gather(
+                *(self.section_chain.ainvoke(self._section_input(*section)) for section in missing)
+            )
+            if not self._store_sections(missing, outputs, merged):
+                return None
+        return merged
+
+    @staticmethod
+    async def _parse_full_text(resume_text: str, invoke, sleep) -> Dict[str, Any]:
+        """Whole-resume prompt with retries and exponential backoff.
 
-        # Call LLM with retries and exponential backoff
+        `invoke` and `sleep` are either both plain callables, in which case
+        the coroutine never suspends and parse_resume runs it with _run_sync,
+        or both coroutine functions, for aparse_resume.
+        """
         attempts = 3
         backoff = 1
         last_exc = None
         for attempt in range(attempts):
             try:
-                llm_output = self.chain.invoke({"resume_text": resume_text})
+                llm_output = await _maybe_await(invoke({"resume_text": resume_text}))
                 try:
                     parsed_data = json.loads(llm_output)
                 except Exception:
+                    parsed_data = None
+                if not isinstance(parsed_data, dict):
                     parsed_data = {"raw_output": llm_output}
 
                 parsed_data["raw_text"] = resume_text
@@ -101,9 +281,65 @@ class RAGResumeParser:
             except Exception as e:
                 last_exc = e
                 logger.exception("RAG parser attempt %s failed: %s", attempt + 1, e)
-                time.sleep(backoff)
-                backoff *= 2
+                if attempt + 1 < attempts:
+                    await _maybe_await(sleep(backoff))
+                    backoff *= 2
 
         logger.error("RAG parser failed after %s attempts: %s", attempts, last_exc)
         # On repeated failure, return raw text and an error field
         return {"raw_text": resume_text, "raw_output": None, "error": str(last_exc)}
+
+    def parse_resume(self, filepath: str, mimetype: str) -> Dict[str, Any]:
+        resume_text = self.extract_text_from_file(filepath, mimetype)
+
+        # If no LLM available, return raw_text only and mark raw_output
+        if not self.chain:
+            logger.info("RAG chain not available; returning raw text only")
+            return {"raw_text": resume_text, "raw_output": None}
+
+        # Sectioned prompts first; the whole-resume prompt covers unstructured text
+        try:
+            parsed_data = self._parse_sections(resume_text)
+        except Exception as e:
+            logger.warning("Sectioned RAG parse failed, using full text: %s", e)
+            parsed_data = None
+        if parsed_data:
+            parsed_data["raw_text"] = resume_text
+            return parsed_data
+
+        return _run_sync(self._parse_full_text(resume_text, self.chain.invoke, time.sleep))
+
+    async def aparse_resume(self, filepath: str, mimetype: str) -> Dict[str, Any]:
+        """Async parse_resume: text extraction in a thread, LLM call via ainvoke."""
+        resume_text = await asyncio.to_thread(self.extract_text_from_file, filepath, mimetype)
+
+        if not self.chain:
+            logger.info("RAG chain not available; returning raw text only")
+            return {"raw_text": resume_text, "raw_output": None}
+
+        try:
+            parsed_data = await self._aparse_sections(resume_text)
+        except Exception as e:
+            logger.warning("Sectioned RAG parse failed, using full text: %s", e)
+            parsed_data = None
+        if parsed_data:
+            parsed_data["raw_text"] = resume_text
+            return parsed_data
+
+        return await self._parse_full_text(resume_text, self.chain.ainvoke, asyncio.sleep)
+
+    async def aparse_many(self, files: List[Tuple[str, str]], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Parse (filepath, mimetype) pairs concurrently, at most `concurrency` LLM calls in flight."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(filepath: str, mimetype: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aparse_resume(filepath, mimetype)
+
+        return await asyncio.gather(*(_one(path, mime) for path, mime in files))
+
+
+@lru_cache(maxsize=1)
+def get_rag_resume_parser() -> RAGResumeParser:
+    """Shared RAGResumeParser, so the LLM client and chains are built once per process."""
+    return RAGResumeParser()
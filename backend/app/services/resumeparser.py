@@ -1,31 +1,311 @@
 import spacy
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pypdf import PdfReader
 from docx import Document
+from lxml import etree
+import orjson
+from app.core.config import settings
 import re
 import os
-import json
+import asyncio
+import copy
+import hashlib
 import logging
+import multiprocessing
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from difflib import SequenceMatcher
+from functools import lru_cache, wraps
+from itertools import islice
 
 try:
     import pdfplumber
 except Exception:
     pdfplumber = None
 
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+try:
+    import pymupdf
+except Exception:
+    pymupdf = None
+
+try:
+    import pypdfium2 as pdfium
+except Exception:
+    pdfium = None
+
+try:
+    import xxhash
+except Exception:
+    xxhash = None
+
+try:
+    import rapidfuzz
+except Exception:
+    rapidfuzz = None
+
 logger = logging.getLogger(__name__)
 
+# Compiled once; the extractors below only need the first hit (or the max)
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", re.ASCII)
+_PHONE_RE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+# Stated years ("5+ years of experience") and year ranges ("2016-2020") in one scan
+_EXPERIENCE_YEARS_RE = re.compile(
+    r"(?P<years>\d+)\s*(?:\+)?\s*years?\s+(?:of\s+)?experience|(?P<start>\d{4})\s*[-–]\s*(?P<end>\d{4})",
+    re.IGNORECASE,
+)
+
+# Experience and education line patterns
+_EXP_DATE_RE = re.compile(
+    r"(?:\d{4}\s*[-–]\s*(?:\d{4}|present|current|now)|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",
+    re.IGNORECASE,
+)
+_TITLE_AT_COMPANY_RE = re.compile(r"^(?P<title>.+?)\s+at\s+(?P<company>.+)$", re.IGNORECASE)
+_TITLE_KEYWORD_RE = re.compile(r"\b(Senior|Lead|Principal|Staff|Software|Developer|Engineer|Manager|Director|Architect|Consultant)\b", re.IGNORECASE)
+_DEGREE_RE = re.compile(r"\b(BS|BA|B\.Sc|MS|M\.Sc|PhD|MBA|Bachelor|Master|Doctor|Associate|Diploma|Certificate)\b", re.IGNORECASE)
+# Every date pattern needs a digit; this is far cheaper to rule a line out with
+_DIGIT_RE = re.compile(r"\d")
+_EDU_DATE_RE = re.compile(r"\b\d{4}\s*[-–]\s*\d{4}\b|\b\d{4}\b")
+_INSTITUTION_RE = re.compile(r"([A-Z][A-Za-z\s&]+(?:University|College|Institute|School))", re.IGNORECASE)
+
+
+# A name line: two to four capitalised words ("Jane Doe", "Mary-Ann O'Neil", "John Q. Public")
+_NAME_WORD = r"[A-Z](?:[a-z]+|[a-z]*[-'’][A-Z]?[a-z]+)"
+_NAME_LINE_RE = re.compile(rf"{_NAME_WORD}(?:\s+(?:[A-Z]\.|{_NAME_WORD})){{1,3}}")
+_NOT_NAME_WORDS = frozenset(
+    {"resume", "curriculum", "vitae", "profile", "summary", "objective", "contact", "experience", "education", "skills"}
+)
+# The name heuristic only looks at the first few lines at the top of the resume
+NAME_SCAN_CHARS = 500
+NAME_SCAN_LINES = 3
+# NER reads the header first and only goes further down when it finds no
+# PERSON there; the first PERSON/ORG sit at the top of a resume anyway
+NER_HEADER_CHARS = 1500
+NER_MAX_CHARS = 20_000
+
+
+# Components the en_core_web_* pipelines ship that NER never reads
+_SPACY_EXCLUDE = ("parser", "tagger", "morphologizer", "senter", "attribute_ruler", "lemmatizer")
+
+
+def _load_once(fn):
+    """lru_cache whose first call per argument tuple runs under a lock.
+
+    Parse and NER pool threads can ask for the model or skill index at the
+    same moment; plain lru_cache would let each of them build its own copy.
+    """
+    cached = lru_cache(maxsize=None)(fn)
+    lock = threading.Lock()
+
+    @wraps(fn)
+    def wrapper(*args):
+        with lock:
+            return cached(*args)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_load_once
+def _load_spacy_model(names: Tuple[str, ...], pipes: Tuple[str, ...]):
+    """First loadable spaCy model in `names`, shared by every parser in the process."""
+    on_gpu = False
+    if settings.SPACY_USE_GPU:
+        try:
+            # Must run before load so the weights are allocated on the device
+            on_gpu = spacy.require_gpu()
+        except Exception as e:
+            logger.warning("SPACY_USE_GPU is set but no GPU is usable, running NER on CPU: %s", e)
+    for name in names:
+        # Run transformer pipelines under fp16 autocast on the GPU
+        overrides = {"components.transformer.model.mixed_precision": True} if on_gpu and name.endswith("_trf") else {}
+        try:
+            # Excluded components are never deserialised, so their weights are never loaded
+            nlp = spacy.load(name, exclude=list(_SPACY_EXCLUDE), config=overrides)
+        except Exception:
+            if not overrides:
+                continue
+            try:
+                nlp = spacy.load(name, exclude=list(_SPACY_EXCLUDE))
+            except Exception:
+                continue
+        # Only entities are used; switch off anything else the package added
+        nlp.select_pipes(enable=[p for p in pipes if p in nlp.pipe_names])
+        return nlp
+    logger.warning("spaCy models not available; continuing without spaCy NER")
+    return None
+
+
+# Byte table for skill-key normalization: keep [a-z0-9 ], blank everything else
+_NORM_TABLE = bytes(b if b == 0x20 or 0x30 <= b <= 0x39 or 0x61 <= b <= 0x7A else 0x20 for b in range(256))
+
+
+def _normalize_lower(s: str) -> str:
+    """`_normalize` for text that is already lowercase."""
+    # Non-ASCII becomes "?" and then a space, like any other non-[a-z0-9] character
+    return " ".join(s.encode("ascii", "replace").translate(_NORM_TABLE).decode("ascii").split())
+
+
+def _normalize(s: str) -> str:
+    """Lowercase, blank everything but [a-z0-9 ] and collapse spaces, as skill keys are stored."""
+    return _normalize_lower(s.lower())
+
+# WordprocessingML tags read by the streaming DOCX extractor
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_R, _W_T, _W_TAB, _W_BR, _W_CR = (_W_NS + tag for tag in ("p", "r", "t", "tab", "br", "cr"))
+
+
+# Parsed results by file content, so re-uploaded resumes skip extraction and NER.
+# Bump PARSE_CACHE_VERSION whenever the parse output changes shape.
+PARSE_CACHE_SIZE = 256
+PARSE_CACHE_VERSION = 2
+_parse_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _parse_cache_key(filepath: str, mimetype: str) -> Optional[bytes]:
+    # Only equality matters here, so prefer the non-cryptographic xxh3
+    prefix = f"{PARSE_CACHE_VERSION}\0{mimetype}\0".encode("utf-8")
+    digest = xxhash.xxh3_128(prefix) if xxhash is not None else hashlib.blake2b(prefix, digest_size=16)
+    try:
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.digest()
+
+
+def _cached_parse(key: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    if key is None:
+        return None
+    with _parse_cache_lock:
+        hit = _parse_cache.get(key)
+        if hit is None:
+            return None
+        _parse_cache.move_to_end(key)
+    # Callers edit results in place (e.g. re-standardising skills)
+    return copy.deepcopy(hit)
+
+
+def _store_parse(key: Optional[bytes], parsed: Dict[str, Any]) -> None:
+    if key is None or parsed.get("error") is not None:
+        return
+    with _parse_cache_lock:
+        _parse_cache[key] = copy.deepcopy(parsed)
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+
+# Resumes at least this long run NER on a helper thread while the regex and
+# skill extractors run on the caller's; the model's numpy/BLAS work releases
+# the GIL, the extractors don't, so overlapping the two is the parallel win
+PARALLEL_NER_MIN_CHARS = 4096
+_thread_pools: Dict[str, ThreadPoolExecutor] = {}
+_thread_pools_pid: Optional[int] = None
+_thread_pools_lock = threading.Lock()
+
+
+def _get_thread_pool(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Process-wide thread pool called `name`, created on first use."""
+    global _thread_pools_pid
+    # Parse-pool threads ask for the NER pool concurrently
+    with _thread_pools_lock:
+        # A forked child must not reuse the parent's threads
+        if _thread_pools_pid != os.getpid():
+            _thread_pools.clear()
+            _thread_pools_pid = os.getpid()
+        pool = _thread_pools.get(name)
+        if pool is None:
+            pool = _thread_pools[name] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        return pool
+
+
+def _get_ner_pool() -> ThreadPoolExecutor:
+    return _get_thread_pool("resume-ner", min(4, os.cpu_count() or 1))
+
+
+def _get_parse_pool() -> ThreadPoolExecutor:
+    # File extraction spends much of its time in zlib and other native code
+    return _get_thread_pool("resume-parse", os.cpu_count() or 1)
+
+
+# PDFs with at least this many pages split pypdf extraction into page ranges
+# across worker processes; shorter ones aren't worth the round trip
+PARALLEL_PDF_MIN_PAGES = 16
+PDF_POOL_WORKERS = min(4, os.cpu_count() or 1)
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> Optional[ProcessPoolExecutor]:
+    """Process pool for long-PDF page extraction, or None inside a worker process."""
+    global _pdf_pool
+    # parse_many workers (and the pool's own workers) stay serial
+    if multiprocessing.parent_process() is not None:
+        return None
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # spawn, not fork: the server process has live threads
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=PDF_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pdf_pool
+
+
+def _drop_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_pdf_pages(filepath: str, start: int, stop: int) -> List[str]:
+    """pypdf text of pages [start, stop), for the PDF process pool."""
+    with open(filepath, "rb") as file:
+        pages = PdfReader(file).pages
+        return [pages[i].extract_text() or "" for i in range(start, stop)]
+
 
 class FileParseError(Exception):
     pass
 
 
+def _trigrams(s: str) -> set:
+    """Character trigrams of `s`, padded like pg_trgm so short words still share some."""
+    padded = f"  {s} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
 class SkillsStandardizer:
     """Standardize and normalize skills against skills database"""
     
     def __init__(self, skill_database: List[str]):
         self.skill_database = skill_database
         self.skills_lower = {s.lower(): s for s in skill_database}
+        self._choices = list(self.skills_lower)
+        # Trigram -> positions in _choices; fuzzy matching only scores skills
+        # sharing a trigram with the input instead of the whole database
+        self._trigram_index: Dict[str, List[int]] = {}
+        for pos, choice in enumerate(self._choices):
+            for gram in _trigrams(choice):
+                self._trigram_index.setdefault(gram, []).append(pos)
+    
+    def _fuzzy_candidates(self, skill_lower: str) -> List[str]:
+        """Database skills sharing at least one trigram with `skill_lower`, in database order."""
+        positions = set()
+        for gram in _trigrams(skill_lower):
+            positions.update(self._trigram_index.get(gram, ()))
+        return [self._choices[pos] for pos in sorted(positions)]
     
     def normalize_skill(self, skill: str) -> str:
         """Normalize skill name to match database"""
@@ -39,14 +319,24 @@ class SkillsStandardizer:
             return self.skills_lower[skill_lower]
         
         # Fuzzy match for typos/variations (e.g., "pyton" → "Python")
+        candidates = self._fuzzy_candidates(skill_lower)
+        if rapidfuzz is not None:
+            match = rapidfuzz.process.extractOne(
+                skill_lower, candidates, scorer=rapidfuzz.fuzz.ratio, score_cutoff=80
+            )
+            # Same strict "> 80%" threshold as the SequenceMatcher fallback
+            if match is not None and match[1] > 80:
+                return self.skills_lower[match[0]]
+            return skill
+
         best_match = None
         best_ratio = 0.0
         
-        for db_skill_lower, db_skill in self.skills_lower.items():
+        for db_skill_lower in candidates:
             ratio = SequenceMatcher(None, skill_lower, db_skill_lower).ratio()
             if ratio > best_ratio:
                 best_ratio = ratio
-                best_match = db_skill
+                best_match = self.skills_lower[db_skill_lower]
         
         # Return fuzzy match if similarity > 0.8 (80%)
         if best_ratio > 0.8:
@@ -66,52 +356,139 @@ class SkillsStandardizer:
             if normalized:
                 standardized.add(normalized)
         
-        return sorted(list(standardized))
+        return sorted(standardized)
+
+
+_UNLOADED = object()
 
 
 class ResumeParser:
-    def __init__(self):
-        # Load spaCy model (prefer transformer if available).
-        try:
-            self.nlp = spacy.load("en_core_web_trf")
-        except Exception:
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except Exception:
-                logger.warning("spaCy models not available; continuing without spaCy NER")
-                self.nlp = None
+    # Pipeline components NER needs; everything else is switched off after load
+    NER_PIPES = ("transformer", "tok2vec", "ner")
+    # The small CNN model loads in well under a second; the transformer is the
+    # fallback, or the first choice with SPACY_HIGH_ACCURACY
+    SPACY_MODELS = ("en_core_web_sm", "en_core_web_trf")
 
-        # Load skill database from file if available
-        self.skill_database = self._load_skill_database()
-        
-        # ✅ NEW: Initialize skills standardizer
-        self.skills_standardizer = SkillsStandardizer(self.skill_database)
+    def __init__(self, lazy_spacy: bool = True):
+        # The spaCy model loads on first use of `nlp`, and only once per process
+        self._nlp = _UNLOADED
+        if not lazy_spacy:
+            self._nlp = self._load_nlp()
 
-        # Build a normalization map from possible aliases/synonyms to canonical skill names
+        # Skill database, standardizer, alias map and automata are read-only and
+        # built once per process, not once per parser
+        (
+            self.skill_database,
+            self.skills_standardizer,
+            self.skill_map,
+            self._skill_automata,
+            self._alias_prefixes,
+            self._normalized_canonicals,
+        ) = _shared_skill_index()
+
+    @staticmethod
+    def _page_texts(pages, extract, max_pages: Optional[int], max_chars: Optional[int]) -> List[str]:
+        """Text of each page in order, stopping at `max_pages` or once `max_chars` are collected."""
+        parts: List[str] = []
+        total = 0
+        for page in islice(pages, max_pages):
+            page_text = extract(page) or ""
+            parts.append(page_text)
+            total += len(page_text)
+            if max_chars is not None and total >= max_chars:
+                break
+        return parts
+
+    @staticmethod
+    def _pdfium_page_text(page) -> str:
+        """Flat text of one PDFium page, closing the native handles straight away."""
+        textpage = page.get_textpage()
         try:
-            self.skill_map = self._build_skill_map(self.skill_database)
-        except Exception:
-            logger.exception("Failed to build skill normalization map; falling back to simple list")
-            self.skill_map = {}
+            return textpage.get_text_range().replace("\r\n", "\n")
+        finally:
+            textpage.close()
+            page.close()
+
+    @staticmethod
+    def _parallel_page_texts(filepath: str, page_count: int) -> List[str]:
+        """pypdf text of the first `page_count` pages, one range per pool worker; [] if unavailable."""
+        pool = _get_pdf_pool()
+        if pool is None:
+            return []
+        step = -(-page_count // PDF_POOL_WORKERS)
+        try:
+            futures = [
+                pool.submit(_extract_pdf_pages, filepath, start, min(start + step, page_count))
+                for start in range(0, page_count, step)
+            ]
+            return [text for future in futures for text in future.result()]
+        except BrokenProcessPool as e:
+            # A worker died (e.g. OOM-killed); the next long PDF gets a fresh pool
+            logger.warning("PDF process pool broke on %s, extracting serially: %s", filepath, e)
+            _drop_pdf_pool(pool)
+            return []
+        except Exception as e:
+            logger.warning("Parallel PDF extraction failed for %s, extracting serially: %s", filepath, e)
+            return []
+
+    def extract_text_from_pdf(
+        self, filepath: str, max_pages: Optional[int] = None, max_chars: Optional[int] = None
+    ) -> str:
+        """Extract text from PDF. Use PyMuPDF or PDFium if installed, then pypdf, then pdfplumber.
+
+        `max_pages` stops after the first N pages and `max_chars` after the page
+        that reaches N characters (whole pages are kept); None reads everything.
+        """
+        if pymupdf is not None:
+            try:
+                with pymupdf.open(filepath) as doc:
+                    if doc.needs_pass:
+                        logger.exception("PDF is encrypted or password-protected: %s", filepath)
+                        raise FileParseError("PDF is encrypted or password-protected")
+                    text = "\n".join(
+                        self._page_texts(doc, lambda page: page.get_text("text"), max_pages, max_chars)
+                    )
+                if text.strip():
+                    return text
+            except FileParseError:
+                raise
+            except Exception as e:
+                logger.warning("PyMuPDF extraction failed for %s, falling back to pypdf: %s", filepath, e)
+
+        if pdfium is not None:
+            try:
+                with pdfium.PdfDocument(filepath) as doc:
+                    text = "\n".join(
+                        self._page_texts(doc, self._pdfium_page_text, max_pages, max_chars)
+                    )
+                if text.strip():
+                    return text
+            except pdfium.PdfiumError as e:
+                if getattr(e, "err_code", None) == pdfium.raw.FPDF_ERR_PASSWORD:
+                    logger.exception("PDF is encrypted or password-protected: %s", filepath)
+                    raise FileParseError("PDF is encrypted or password-protected")
+                logger.warning("PDFium extraction failed for %s, falling back to pypdf: %s", filepath, e)
+            except Exception as e:
+                logger.warning("PDFium extraction failed for %s, falling back to pypdf: %s", filepath, e)
 
-    def extract_text_from_pdf(self, filepath: str) -> str:
-        """Extract text from PDF. Use pypdf first, fallback to pdfplumber if available."""
-        text = ""
+        parts: List[str] = []
         try:
             with open(filepath, "rb") as file:
                 pdfreader = PdfReader(file)
                 if getattr(pdfreader, "is_encrypted", True):
                     logger.exception("PDF is encrypted or password-protected: %s", filepath)
                     raise FileParseError("PDF is encrypted or password-protected")
-                for page in pdfreader.pages:
-                    page_text = page.extract_text() or ""
-                    text += page_text
-            if not text and pdfplumber:
+                page_count = len(pdfreader.pages)
+                if max_pages is not None:
+                    page_count = min(page_count, max_pages)
+                if max_chars is None and page_count >= PARALLEL_PDF_MIN_PAGES:
+                    parts = self._parallel_page_texts(filepath, page_count)
+                if not parts:
+                    parts = self._page_texts(pdfreader.pages, lambda page: page.extract_text(), max_pages, max_chars)
+            if not any(parts) and pdfplumber:
                 try:
                     with pdfplumber.open(filepath) as pdf:
-                        for p in pdf.pages:
-                            page_text = p.extract_text() or ""
-                            text += page_text
+                        parts = self._page_texts(pdf.pages, lambda page: page.extract_text(), max_pages, max_chars)
                 except Exception as e:
                     logger.exception("pdfplumber fallback failed: %s", e)
                     raise FileParseError("Unable to extract text from PDF")
@@ -121,22 +498,49 @@ class ResumeParser:
             logger.exception("pypdf extraction failed for %s: %s", filepath, e)
             if pdfplumber:
                 try:
+                    # Start over rather than append to pages pypdf got through before failing
                     with pdfplumber.open(filepath) as pdf:
-                        for p in pdf.pages:
-                            page_text = p.extract_text() or ""
-                            text += page_text
+                        parts = self._page_texts(pdf.pages, lambda page: page.extract_text(), max_pages, max_chars)
                 except Exception as e2:
                     logger.exception("pdfplumber also failed for %s: %s", filepath, e2)
                     raise FileParseError("Unable to extract text from PDF")
             else:
                 raise FileParseError("Unable to extract text from PDF")
 
+        # Same page separator as the PyMuPDF and PDFium paths
+        text = "\n".join(parts)
         if not text:
             raise FileParseError("PDF contains no extractable text")
 
         return text
 
+    @staticmethod
+    def _stream_docx_text(filepath: str) -> str:
+        """Paragraph text straight from word/document.xml, without python-docx objects."""
+        paragraphs: List[str] = []
+        parts: List[str] = []
+        with zipfile.ZipFile(filepath) as archive, archive.open("word/document.xml") as xml:
+            for _, el in etree.iterparse(xml, tag=(_W_P, _W_T, _W_TAB, _W_BR, _W_CR)):
+                tag = el.tag
+                if tag == _W_T:
+                    if el.text:
+                        parts.append(el.text)
+                elif tag == _W_P:
+                    paragraphs.append("".join(parts))
+                    parts.clear()
+                    # Drop finished paragraphs so memory stays flat on long documents
+                    el.clear()
+                elif el.getparent().tag == _W_R:
+                    # Tab stops under w:pPr are also w:tab; only run-level ones are text
+                    parts.append("\t" if tag == _W_TAB else "\n")
+        return "\n".join(paragraphs)
+
     def extract_text_from_docx(self, filepath: str) -> str:
+        try:
+            return self._stream_docx_text(filepath)
+        except Exception as e:
+            logger.warning("Streaming DOCX extraction failed for %s, falling back to python-docx: %s", filepath, e)
+
         try:
             doc = Document(filepath)
             return "\n".join(paragraph.text for paragraph in doc.paragraphs)
@@ -145,60 +549,68 @@ class ResumeParser:
             raise FileParseError("Unable to extract text from DOCX")
 
     def extract_email(self, text: str) -> Optional[str]:
-        email_pattern = r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else None
+        m = _EMAIL_RE.search(text)
+        return m.group(0) if m else None
 
     def extract_phone(self, text: str) -> Optional[str]:
-        phone_pattern = r"\+?\d[\d\s().-]{7,}\d"
-        phones = re.findall(phone_pattern, text)
-        return phones[0] if phones else None
+        m = _PHONE_RE.search(text)
+        return m.group(0) if m else None
+
+    def extract_skills(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """Extract and standardize skills from text.
 
-    def extract_skills(self, text: str) -> List[str]:
-        """Extract and standardize skills from text"""
+        Pass `text_lower` when the caller already holds `text.lower()`.
+        """
         if not text:
             return []
 
-        def normalize(s: str) -> str:
-            return re.sub(r"[^a-z0-9 ]+", " ", s.lower()).strip()
-
-        norm_text = normalize(text)
-        words = norm_text.split()
-        found = []
-
-        # Build n-grams up to 4 words
-        max_ngram = 4
-        for n in range(1, max_ngram + 1):
-            for i in range(len(words) - n + 1):
-                ngram = " ".join(words[i : i + n])
-                if not ngram:
-                    continue
-                if ngram in self.skill_map:
-                    canonical = self.skill_map[ngram]
-                    if canonical not in found:
-                        found.append(canonical)
-
-        # Also check for direct substring matches
-        for canonical in self.skill_database:
-            try:
-                norm_canon = normalize(canonical)
-                if norm_canon and norm_canon in norm_text and canonical not in found:
-                    found.append(canonical)
-            except Exception:
-                continue
+        if text_lower is None:
+            text_lower = text.lower()
+        norm_text = _normalize_lower(text_lower)
+
+        if self._skill_automata is not None:
+            # One pass per automaton instead of an n-gram loop plus a scan per skill
+            alias_ac, canon_ac = self._skill_automata
+            # dict keys dedupe while keeping first-appearance order
+            hits: Dict[str, None] = {}
+            if alias_ac is not None:
+                hits.update(dict.fromkeys(c for _, c in alias_ac.iter(f" {norm_text} ")))
+            if canon_ac is not None:
+                for _, canons in canon_ac.iter(norm_text):
+                    hits.update(dict.fromkeys(canons))
+            found = list(hits)
+        else:
+            hits = {}
+            words = norm_text.split()
+
+            # Grow n-grams (up to 4 words) from each word only while they are
+            # still the start of some alias, instead of joining every n-gram
+            max_ngram = 4
+            for i in range(len(words)):
+                ngram = ""
+                for word in words[i:i + max_ngram]:
+                    ngram = f"{ngram} {word}" if ngram else word
+                    if ngram in self.skill_map:
+                        hits.setdefault(self.skill_map[ngram])
+                    if ngram not in self._alias_prefixes:
+                        break
+
+            # Also check for direct substring matches
+            for norm_canon, canonical in self._normalized_canonicals:
+                if norm_canon in norm_text:
+                    hits.setdefault(canonical)
+            found = list(hits)
 
         # ✅ STANDARDIZE extracted skills
         standardized = self.skills_standardizer.standardize_skills(found)
         
-        logger.info(f"Extracted {len(found)} skills, standardized to {len(standardized)}")
+        logger.info("Extracted %s skills, standardized to %s", len(found), len(standardized))
         
         return standardized
 
-    def _build_skill_map(self, skills_source: List[str]) -> Dict[str, str]:
+    @staticmethod
+    def _build_skill_map(skills_source: List[str]) -> Dict[str, str]:
         """Create a mapping of normalized alias -> canonical skill name."""
-        def normalize_key(s: str) -> str:
-            return re.sub(r"[^a-z0-9 ]+", " ", s.lower()).strip()
-
         skill_map: Dict[str, str] = {}
 
         builtin_synonyms = {
@@ -229,7 +641,7 @@ class ResumeParser:
             else:
                 continue
 
-            norm = normalize_key(canon)
+            norm = _normalize(canon)
             if norm:
                 skill_map[norm] = canon
 
@@ -238,10 +650,106 @@ class ResumeParser:
                     skill_map[part] = canon
 
         for alias, canon in builtin_synonyms.items():
-            skill_map[normalize_key(alias)] = canon
+            skill_map[_normalize(alias)] = canon
 
         return skill_map
 
+    @staticmethod
+    def _build_alias_prefixes(skill_map: Dict[str, str]) -> set:
+        """Proper word prefixes of multi-word aliases, for the n-gram fallback in extract_skills."""
+        prefixes = set()
+        for alias in skill_map:
+            words = alias.split()
+            for n in range(1, min(len(words), 4)):
+                prefixes.add(" ".join(words[:n]))
+        return prefixes
+
+    @staticmethod
+    def _build_normalized_canonicals(skill_database: List[str]) -> List[Tuple[str, str]]:
+        """(normalized, canonical) pairs in database order, for the substring scan in extract_skills."""
+        pairs = []
+        for canon in skill_database:
+            if not isinstance(canon, str):
+                continue
+            norm = _normalize(canon)
+            if norm:
+                pairs.append((norm, canon))
+        return pairs
+
+    @staticmethod
+    def _build_skill_automata(skill_map: Dict[str, str], skill_database: List[str]):
+        """Aho-Corasick automata for extract_skills, or None without pyahocorasick.
+
+        Returns (alias automaton, canonical automaton). Aliases are padded with
+        spaces so they only match whole words of the space-joined text, like
+        the n-gram lookup; canonical names match anywhere, like the substring
+        scan, and map to the list of skills sharing that normalized form.
+        Either automaton is None when it has no patterns.
+        """
+        if ahocorasick is None:
+            return None
+
+        alias_ac = ahocorasick.Automaton()
+        for alias, canon in skill_map.items():
+            if alias and len(alias.split()) <= 4:
+                alias_ac.add_word(f" {alias} ", canon)
+
+        canon_ac = ahocorasick.Automaton()
+        for canon in skill_database:
+            if not isinstance(canon, str):
+                continue
+            norm = _normalize(canon)
+            if not norm:
+                continue
+            # Several skills can normalize alike ("C++", "C#"); report them all
+            if norm in canon_ac:
+                canon_ac.get(norm).append(canon)
+            else:
+                canon_ac.add_word(norm, [canon])
+
+        automata = []
+        for ac in (alias_ac, canon_ac):
+            if len(ac):
+                ac.make_automaton()
+                automata.append(ac)
+            else:
+                automata.append(None)
+        return tuple(automata)
+
+    def _load_nlp(self):
+        models = self.SPACY_MODELS
+        if settings.SPACY_HIGH_ACCURACY:
+            models = tuple(reversed(models))
+        return _load_spacy_model(models, self.NER_PIPES)
+
+    @property
+    def nlp(self):
+        if self._nlp is _UNLOADED:
+            self._nlp = self._load_nlp()
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, value) -> None:
+        self._nlp = value
+
+    @staticmethod
+    def extract_name(text: str) -> Optional[str]:
+        """Name from the first lines of the resume by shape alone, or None."""
+        lines = (line.strip() for line in text[:NAME_SCAN_CHARS].splitlines())
+        for line in islice((line for line in lines if line), NAME_SCAN_LINES):
+            if (
+                _NAME_LINE_RE.fullmatch(line)
+                and not _TITLE_KEYWORD_RE.search(line)
+                and _NOT_NAME_WORDS.isdisjoint(line.lower().split())
+            ):
+                return line
+        return None
+
+    def _heuristic_info(self, text: str) -> Optional[Dict[str, Optional[str]]]:
+        """Stand-in for NER output when the name can be read off the top of the resume."""
+        name = self.extract_name(text)
+        return {"name": name, "company": None} if name else None
+
     def _extract_with_spacy(self, text: str) -> Dict[str, Optional[str]]:
         """Use spaCy NER to enrich personal/company info when model is available."""
         out = {"name": None, "company": None}
@@ -249,237 +757,326 @@ class ResumeParser:
             return out
 
         try:
-            doc = self.nlp(text)
-            for ent in doc.ents:
-                if ent.label_ == "PERSON" and not out["name"]:
-                    out["name"] = ent.text
-                if ent.label_ == "ORG" and not out["company"]:
-                    out["company"] = ent.text
-                if out["name"] and out["company"]:
-                    break
+            out = self._entities_from_doc(self.nlp(text[:NER_HEADER_CHARS]))
+            if out["name"] is None and len(text) > NER_HEADER_CHARS:
+                out = self._entities_from_doc(self.nlp(text[:NER_MAX_CHARS]))
+            return out
         except Exception as e:
             logger.exception("spaCy NER failed: %s", e)
 
         return out
 
-    def extract_experience(self, text: str) -> List[Dict[str, Optional[str]]]:
-        """Extract structured work experience entries from text."""
-        experiences: List[Dict[str, Optional[str]]] = []
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
+    @staticmethod
+    def _entities_from_doc(doc) -> Dict[str, Optional[str]]:
+        """First PERSON and ORG entity of a processed spaCy Doc."""
+        out = {"name": None, "company": None}
+        for ent in doc.ents:
+            if ent.label_ == "PERSON" and not out["name"]:
+                out["name"] = ent.text
+            if ent.label_ == "ORG" and not out["company"]:
+                out["company"] = ent.text
+            if out["name"] and out["company"]:
+                break
+        return out
 
-        date_pattern = r"(?:\d{4}\s*[-–]\s*(?:\d{4}|present|current|now)|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})"
-        title_company_pattern = re.compile(r"^(?P<title>.+?)\s+at\s+(?P<company>.+)$", re.IGNORECASE)
-        title_keywords = re.compile(r"\b(Senior|Lead|Principal|Staff|Software|Developer|Engineer|Manager|Director|Architect|Consultant)\b", re.IGNORECASE)
+    # extract_experience / extract_education keep at most this many unique entries
+    MAX_SECTION_ENTRIES = 10
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            if len(line) < 6:
-                i += 1
-                continue
+    @staticmethod
+    def _content_lines(text: str) -> List[str]:
+        # Each line stripped once, and the loop stays in C
+        return list(filter(None, map(str.strip, text.splitlines())))
 
-            entry: Dict[str, Optional[str]] = {}
-
-            # Case 1: "Title at Company" line possibly followed by a date line
-            m = title_company_pattern.match(line)
-            if m:
-                entry["title"] = m.group("title").strip()
-                entry["company"] = m.group("company").strip()
-                # Look ahead for a dates line within next 2 lines
-                lookahead = 1
-                while lookahead <= 2 and i + lookahead < len(lines):
-                    la = lines[i + lookahead]
-                    d = re.search(date_pattern, la, re.IGNORECASE)
-                    if d:
-                        entry["dates"] = d.group().strip()
-                        break
-                    lookahead += 1
-                if entry:
-                    experiences.append(entry)
-                i += 1
-                continue
+    @staticmethod
+    def _experience_at(lines: List[str], i: int) -> Optional[Dict[str, Optional[str]]]:
+        """Experience entry anchored at lines[i], or None."""
+        line = lines[i]
+        if len(line) < 6:
+            return None
+
+        entry: Dict[str, Optional[str]] = {}
+
+        # Case 1: "Title at Company" line possibly followed by a date line
+        m = _TITLE_AT_COMPANY_RE.match(line)
+        if m:
+            entry["title"] = m.group("title").strip()
+            entry["company"] = m.group("company").strip()
+            # Look ahead for a dates line within next 2 lines
+            for la in lines[i + 1:i + 3]:
+                d = _DIGIT_RE.search(la) and _EXP_DATE_RE.search(la)
+                if d:
+                    entry["dates"] = d.group().strip()
+                    break
+            return entry
 
-            # Case 2: Date line first, followed by title/company info
-            d = re.search(date_pattern, line, re.IGNORECASE)
+        # Case 2: Date line first, followed by title/company info
+        d = _DIGIT_RE.search(line) and _EXP_DATE_RE.search(line)
+        if d:
+            entry["dates"] = d.group().strip()
+            # Look back and ahead for title/company
+            # Prefer the immediate previous or next line containing keywords
+            prev = lines[i - 1] if i - 1 >= 0 else ""
+            nxt = lines[i + 1] if i + 1 < len(lines) else ""
+            for candidate in (prev, nxt):
+                if _TITLE_KEYWORD_RE.search(candidate):
+                    mm = _TITLE_AT_COMPANY_RE.match(candidate)
+                    if mm:
+                        entry["title"] = mm.group("title").strip()
+                        entry["company"] = mm.group("company").strip()
+                    else:
+                        entry.setdefault("title", candidate.strip())
+            return entry
+
+        return None
+
+    @staticmethod
+    def _education_at(lines: List[str], i: int) -> Optional[Dict[str, Optional[str]]]:
+        """Education entry anchored at a degree line lines[i], or None."""
+        line = lines[i]
+        if not _DEGREE_RE.search(line):
+            return None
+
+        entry: Dict[str, Optional[str]] = {"degree": line.strip()}
+        # Look ahead up to 2 lines for institution and dates (e.g., "Tech University, 2015-2019")
+        for la in lines[i + 1:i + 3]:
+            inst = _INSTITUTION_RE.search(la)
+            if inst and not entry.get("institution"):
+                entry["institution"] = inst.group(1).strip()
+            d = _DIGIT_RE.search(la) and _EDU_DATE_RE.search(la)
             if d:
-                entry["dates"] = d.group().strip()
-                # Look back and ahead for title/company
-                # Prefer the immediate previous or next line containing keywords
-                prev = lines[i - 1] if i - 1 >= 0 else ""
-                nxt = lines[i + 1] if i + 1 < len(lines) else ""
-                for candidate in (prev, nxt):
-                    if title_keywords.search(candidate):
-                        mm = title_company_pattern.match(candidate)
-                        if mm:
-                            entry["title"] = mm.group("title").strip()
-                            entry["company"] = mm.group("company").strip()
-                        else:
-                            entry.setdefault("title", candidate.strip())
-                experiences.append(entry)
-                i += 1
-                continue
+                entry["dates"] = d.group(0)
+        # If institution or dates found in same line
+        if not entry.get("institution"):
+            inst_same = _INSTITUTION_RE.search(line)
+            if inst_same:
+                entry["institution"] = inst_same.group(1).strip()
+        if not entry.get("dates"):
+            d_same = _DIGIT_RE.search(line) and _EDU_DATE_RE.search(line)
+            if d_same:
+                entry["dates"] = d_same.group(0)
+        return entry
 
-            i += 1
+    def _extract_sections(
+        self, text: str, experience: bool = True, education: bool = True
+    ) -> Tuple[List[Dict[str, Optional[str]]], List[Dict[str, Optional[str]]]]:
+        """Experience and education entries from one pass over the lines.
 
-        # Deduplicate and keep up to 10
-        clean_experiences: List[Dict[str, Optional[str]]] = []
-        seen = set()
-        for exp in experiences:
-            key = (exp.get("company", ""), exp.get("title", ""), exp.get("dates", ""))
-            if key not in seen and (exp.get("company") or exp.get("title") or exp.get("dates")):
-                seen.add(key)
-                clean_experiences.append(exp)
+        Entries are deduplicated as they are found, and the scan stops once
+        every requested list holds MAX_SECTION_ENTRIES.
+        """
+        lines = self._content_lines(text)
+        limit = self.MAX_SECTION_ENTRIES
+        experiences: List[Dict[str, Optional[str]]] = []
+        educations: List[Dict[str, Optional[str]]] = []
+        seen_exp = set()
+        seen_edu = set()
+        want_exp, want_edu = experience, education
 
-        return clean_experiences[:10]
+        for i in range(len(lines)):
+            if not (want_exp or want_edu):
+                break
+            if want_exp:
+                exp = self._experience_at(lines, i)
+                if exp:
+                    key = (exp.get("company", ""), exp.get("title", ""), exp.get("dates", ""))
+                    if key not in seen_exp and (exp.get("company") or exp.get("title") or exp.get("dates")):
+                        seen_exp.add(key)
+                        experiences.append(exp)
+                        want_exp = len(experiences) < limit
+            if want_edu:
+                edu = self._education_at(lines, i)
+                if edu:
+                    key = (edu.get("degree", ""), edu.get("institution", ""), edu.get("dates", ""))
+                    if key not in seen_edu and edu.get("degree"):
+                        seen_edu.add(key)
+                        educations.append(edu)
+                        want_edu = len(educations) < limit
 
-    def extract_education(self, text: str) -> List[Dict[str, Optional[str]]]:
-        """Extract structured education entries from text."""
-        results: List[Dict[str, Optional[str]]] = []
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
-
-        degree_pattern = re.compile(r"\b(BS|BA|B\.Sc|MS|M\.Sc|PhD|MBA|Bachelor|Master|Doctor|Associate|Diploma|Certificate)\b", re.IGNORECASE)
-        date_pattern = re.compile(r"\b\d{4}\s*[-–]\s*\d{4}\b|\b\d{4}\b")
-        institution_pattern = re.compile(r"([A-Z][A-Za-z\s&]+(?:University|College|Institute|School))", re.IGNORECASE)
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            if degree_pattern.search(line):
-                entry: Dict[str, Optional[str]] = {"degree": line.strip()}
-                # Look ahead up to 2 lines for institution and dates (e.g., "Tech University, 2015-2019")
-                for j in range(1, 3):
-                    if i + j >= len(lines):
-                        break
-                    la = lines[i + j]
-                    inst = institution_pattern.search(la)
-                    if inst and not entry.get("institution"):
-                        entry["institution"] = inst.group(1).strip()
-                    d = date_pattern.search(la)
-                    if d:
-                        entry["dates"] = d.group(0)
-                # If institution or dates found in same line
-                if not entry.get("institution"):
-                    inst_same = institution_pattern.search(line)
-                    if inst_same:
-                        entry["institution"] = inst_same.group(1).strip()
-                if not entry.get("dates"):
-                    d_same = date_pattern.search(line)
-                    if d_same:
-                        entry["dates"] = d_same.group(0)
-                results.append(entry)
-                i += 1
-                continue
-            i += 1
+        return experiences, educations
 
-        # Deduplicate and keep up to 10
-        cleaned: List[Dict[str, Optional[str]]] = []
-        seen = set()
-        for edu in results:
-            key = (edu.get("degree", ""), edu.get("institution", ""), edu.get("dates", ""))
-            if key not in seen and edu.get("degree"):
-                seen.add(key)
-                cleaned.append(edu)
+    def extract_experience(self, text: str) -> List[Dict[str, Optional[str]]]:
+        """Extract structured work experience entries from text."""
+        return self._extract_sections(text, education=False)[0]
 
-        return cleaned[:10]
+    def extract_education(self, text: str) -> List[Dict[str, Optional[str]]]:
+        """Extract structured education entries from text."""
+        return self._extract_sections(text, experience=False)[1]
 
     def calculate_experience_years(self, text: str) -> int:
-        pattern = r"(\d+)\s*(?:\+)?\s*years?\s+(?:of\s+)?experience"
-        matches = re.findall(pattern, text.lower())
-        if matches:
-            years = [int(m) for m in matches if m.isdigit()]
-            return max(years) if years else 0
-        ranges = re.findall(r"(\d{4})\s*[-–]\s*(\d{4})", text)
+        # A stated figure wins over summed ranges
+        stated = None
         total = 0
-        for start, end in ranges:
-            try:
-                total += int(end) - int(start)
-            except Exception:
-                continue
-        return total
+        for m in _EXPERIENCE_YEARS_RE.finditer(text):
+            years = m.group("years")
+            if years is not None:
+                stated = max(stated or 0, int(years))
+            elif stated is None:
+                total += int(m.group("end")) - int(m.group("start"))
+        return stated if stated is not None else total
+
+    def _read_text(self, filepath: str, mimetype: str) -> str:
+        if mimetype == "application/pdf":
+            return self.extract_text_from_pdf(filepath)
+        if (
+            mimetype.endswith("wordprocessingml.document")
+            or mimetype == "application/msword"
+            or filepath.lower().endswith('.docx')
+        ):
+            return self.extract_text_from_docx(filepath)
+        raise FileParseError(f"Unsupported file type: {mimetype}")
+
+    def _build_parsed(
+        self, text: str, spacy_info: Union[Dict[str, Optional[str]], "Future[Dict[str, Optional[str]]]"]
+    ) -> Dict[str, Any]:
+        personal_info = {
+            "name": None,
+            "email": self.extract_email(text),
+            "phone": self.extract_phone(text),
+            "location": None
+        }
+
+        # Experience and education share one pass over the lines
+        experience_entries, education_entries = self._extract_sections(text)
+        
+        # Lowercased once for every case-insensitive extractor below
+        text_lower = text.lower()
+
+        # ✅ Extract and standardize skills
+        skills = self.extract_skills(text, text_lower)
+
+        # NER may still be running on the pool; only the name is needed from it
+        if isinstance(spacy_info, Future):
+            spacy_info = spacy_info.result()
+        personal_info["name"] = spacy_info.get("name")
+
+        required_fields = [
+            personal_info.get("name"),
+            personal_info.get("email"),
+            bool(experience_entries),
+            bool(education_entries)
+        ]
+        confidence_score = sum(1 for f in required_fields if f) / len(required_fields)
+
+        return {
+            "raw_text": text,
+            "personal_info": personal_info,
+            "skills": skills,  # ✅ Now standardized!
+            "experience": experience_entries,
+            "education": education_entries,
+            "experience_years": self.calculate_experience_years(text_lower),
+            "confidence_score": round(confidence_score, 2),
+            "error": None
+        }
+
+    @staticmethod
+    def _error_result(error: str) -> Dict[str, Any]:
+        return {
+            "raw_text": None,
+            "personal_info": None,
+            "skills": [],
+            "experience": [],
+            "education": [],
+            "experience_years": None,
+            "confidence_score": 0.0,
+            "error": error
+        }
 
     def parse_resume(self, filepath: str, mimetype: str) -> Dict[str, Any]:
-        """Parse resume and return structured data matching ParseResumeResponse schema."""
+        """Parse resume and return structured data matching ParseResumeResponse schema.
+
+        Successful results are cached by file content, so identical uploads skip
+        extraction and NER.
+        """
+        key = _parse_cache_key(filepath, mimetype)
+        cached = _cached_parse(key)
+        if cached is not None:
+            return cached
         try:
-            if mimetype == "application/pdf":
-                text = self.extract_text_from_pdf(filepath)
-            elif (
-                mimetype.endswith("wordprocessingml.document")
-                or mimetype == "application/msword"
-                or filepath.lower().endswith('.docx')
-            ):
-                text = self.extract_text_from_docx(filepath)
-            else:
-                raise FileParseError(f"Unsupported file type: {mimetype}")
-
-            spacy_info = self._extract_with_spacy(text)
-            
-            personal_info = {
-                "name": spacy_info.get("name"),
-                "email": self.extract_email(text),
-                "phone": self.extract_phone(text),
-                "location": None
-            }
-
-            experience_entries = self.extract_experience(text)
-            education_entries = self.extract_education(text)
-            
-            # ✅ Extract and standardize skills
-            skills = self.extract_skills(text)
-
-            required_fields = [
-                personal_info.get("name"),
-                personal_info.get("email"),
-                bool(experience_entries),
-                bool(education_entries)
-            ]
-            confidence_score = sum(1 for f in required_fields if f) / len(required_fields)
-
-            parsed_data = {
-                "raw_text": text,
-                "personal_info": personal_info,
-                "skills": skills,  # ✅ Now standardized!
-                "experience": experience_entries,
-                "education": education_entries,
-                "experience_years": self.calculate_experience_years(text),
-                "confidence_score": round(confidence_score, 2),
-                "error": None
-            }
-
-            return parsed_data
-            
+            text = self._read_text(filepath, mimetype)
+            # NER only runs when the name can't be read off the first lines
+            spacy_info = self._heuristic_info(text)
+            if spacy_info is None:
+                if self.nlp is not None and len(text) >= PARALLEL_NER_MIN_CHARS:
+                    spacy_info = _get_ner_pool().submit(self._extract_with_spacy, text)
+                else:
+                    spacy_info = self._extract_with_spacy(text)
+            parsed = self._build_parsed(text, spacy_info)
+            _store_parse(key, parsed)
+            return parsed
         except FileParseError as e:
-            return {
-                "raw_text": None,
-                "personal_info": None,
-                "skills": [],
-                "experience": [],
-                "education": [],
-                "experience_years": None,
-                "confidence_score": 0.0,
-                "error": str(e)
-            }
+            return self._error_result(str(e))
         except Exception as e:
             logger.exception("Unexpected error parsing resume")
-            return {
-                "raw_text": None,
-                "personal_info": None,
-                "skills": [],
-                "experience": [],
-                "education": [],
-                "experience_years": None,
-                "confidence_score": 0.0,
-                "error": f"Unexpected error: {str(e)}"
-            }
-
-    def _load_skill_database(self) -> List[str]:
+            return self._error_result(f"Unexpected error: {str(e)}")
+
+    async def parse_resume_async(self, filepath: str, mimetype: str) -> Dict[str, Any]:
+        """parse_resume on the shared parse thread pool, keeping the event loop free."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_parse_pool(), self.parse_resume, filepath, mimetype)
+
+    async def parse_resumes_async(self, files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """parse_resume_async over (filepath, mimetype) pairs, concurrently, in input order."""
+        return await asyncio.gather(*(self.parse_resume_async(path, mime) for path, mime in files))
+
+    def parse_resumes(self, files: List[Tuple[str, str]], batch_size: int = 32) -> List[Dict[str, Any]]:
+        """Parse several (filepath, mimetype) pairs, in order.
+
+        Same output as calling parse_resume per file, but NER runs through
+        nlp.pipe so the model sees padded batches instead of one doc at a time.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        keys = [_parse_cache_key(filepath, mimetype) for filepath, mimetype in files]
+        texts: List[str] = []
+        positions: List[int] = []
+        for i, (filepath, mimetype) in enumerate(files):
+            results[i] = _cached_parse(keys[i])
+            if results[i] is not None:
+                continue
+            try:
+                texts.append(self._read_text(filepath, mimetype))
+                positions.append(i)
+            except FileParseError as e:
+                results[i] = self._error_result(str(e))
+            except Exception as e:
+                logger.exception("Unexpected error parsing resume")
+                results[i] = self._error_result(f"Unexpected error: {str(e)}")
+
+        infos = [self._heuristic_info(text) for text in texts]
+        pending = [j for j, info in enumerate(infos) if info is None]
+        empty = {"name": None, "company": None}
+        if pending and self.nlp is not None:
+            try:
+                docs = self.nlp.pipe((texts[j][:NER_HEADER_CHARS] for j in pending), batch_size=batch_size)
+                for j, doc in zip(pending, docs):
+                    infos[j] = self._entities_from_doc(doc)
+                # Second, longer pass only for headers without a PERSON
+                longer = [j for j in pending if infos[j]["name"] is None and len(texts[j]) > NER_HEADER_CHARS]
+                docs = self.nlp.pipe((texts[j][:NER_MAX_CHARS] for j in longer), batch_size=batch_size)
+                for j, doc in zip(longer, docs):
+                    infos[j] = self._entities_from_doc(doc)
+            except Exception as e:
+                logger.exception("spaCy NER failed: %s", e)
+        infos = [info or empty for info in infos]
+
+        for i, text, info in zip(positions, texts, infos):
+            try:
+                results[i] = self._build_parsed(text, info)
+                _store_parse(keys[i], results[i])
+            except Exception as e:
+                logger.exception("Unexpected error parsing resume")
+                results[i] = self._error_result(f"Unexpected error: {str(e)}")
+        return results
+
+    @staticmethod
+    def _load_skill_database() -> List[str]:
         """Load skills from skills.json"""
         base_dir = os.path.dirname(__file__)
         skills_file = os.path.join(base_dir, "skills.json")
         
         if os.path.exists(skills_file):
             try:
-                with open(skills_file, "r", encoding="utf-8") as fh:
-                    data = json.load(fh)
+                with open(skills_file, "rb") as fh:
+                    data = orjson.loads(fh.read())
                     # Handle both list and dict formats
                     if isinstance(data, list):
                         return data
@@ -499,3 +1096,101 @@ class ResumeParser:
             "Redis", "Kafka", "GraphQL", "REST", "HTML", "CSS", "Tailwind",
             "React Native", "Flutter", "iOS", "Android", "Java", "C++", "Go"
         ]
+
+
+@_load_once
+def _shared_skill_index() -> Tuple[
+    List[str], SkillsStandardizer, Dict[str, str], Any, set, List[Tuple[str, str]]
+]:
+    """(skill database, standardizer, alias map, automata, alias prefixes,
+    normalized canonicals), built on first use."""
+    skill_database = ResumeParser._load_skill_database()
+    # Build a normalization map from possible aliases/synonyms to canonical skill names
+    try:
+        skill_map = ResumeParser._build_skill_map(skill_database)
+    except Exception:
+        logger.exception("Failed to build skill normalization map; falling back to simple list")
+        skill_map = {}
+    return (
+        skill_database,
+        SkillsStandardizer(skill_database),
+        skill_map,
+        ResumeParser._build_skill_automata(skill_map, skill_database),
+        ResumeParser._build_alias_prefixes(skill_map),
+        ResumeParser._build_normalized_canonicals(skill_database),
+    )
+
+
+@_load_once
+def get_resume_parser() -> ResumeParser:
+    """Shared ResumeParser, so the spaCy model and skill automata load once per process."""
+    return ResumeParser()
+
+# Per-process parser for parse_many workers (spaCy model loaded once per worker)
+_worker_parser: Optional[ResumeParser] = None
+
+
+def _init_worker() -> None:
+    global _worker_parser
+    _worker_parser = get_resume_parser()
+
+
+def _parse_in_worker(item: Tuple[str, str]) -> Dict[str, Any]:
+    filepath, mimetype = item
+    return _worker_parser.parse_resume(filepath, mimetype)
+
+
+# parse_many pools by size, kept alive so workers load spaCy once, not once per batch
+_worker_pools: Dict[int, ProcessPoolExecutor] = {}
+_worker_pools_pid: Optional[int] = None
+_worker_pools_lock = threading.Lock()
+
+
+def _get_worker_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _worker_pools_pid
+    with _worker_pools_lock:
+        if _worker_pools_pid != os.getpid():
+            _worker_pools.clear()
+            _worker_pools_pid = os.getpid()
+        pool = _worker_pools.get(max_workers)
+        if pool is None:
+            # spawn, not fork: a forked worker could inherit a model or
+            # _load_once lock held by one of the server's threads
+            pool = _worker_pools[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return pool
+
+
+def _drop_worker_pool(max_workers: int, pool: ProcessPoolExecutor) -> None:
+    with _worker_pools_lock:
+        if _worker_pools.get(max_workers) is pool:
+            del _worker_pools[max_workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_many(files: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Parse (filepath, mimetype) pairs across worker processes, in input order.
+
+    PDF extraction, regex scanning and NER are CPU-bound and hold the GIL, so
+    a batch only scales across processes. Each worker builds its own
+    ResumeParser once and reuses it for every file it is handed, across
+    calls: pools stay up for the life of the process.
+    """
+    files = list(files)
+    if not files:
+        return []
+    max_workers = min(max_workers or os.cpu_count() or 1, len(files))
+    if max_workers == 1:
+        parser = get_resume_parser()
+        return [parser.parse_resume(path, mime) for path, mime in files]
+    chunksize = max(1, len(files) // (max_workers * 4))
+    pool = _get_worker_pool(max_workers)
+    try:
+        return list(pool.map(_parse_in_worker, files, chunksize=chunksize))
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); the next call gets a fresh pool
+        _drop_worker_pool(max_workers, pool)
+        raise
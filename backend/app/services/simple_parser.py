@@ -110,6 +110,16 @@ class SimpleParser:
                 r')\b',
                 re.IGNORECASE
             ),
+            
+            # Education section body, up to the next section heading
+            'section': re.compile(
+                r'(?:EDUCATION|ACADEMIC|QUALIFICATIONS|DEGREES|SCHOOLING)[^\n]*\n(.*?)'
+                r'(?=\n\n?(?:EXPERIENCE|WORK|EMPLOYMENT|SKILLS|PROJECTS|CERTIFICATIONS|SUMMARY)|$)',
+                re.IGNORECASE | re.DOTALL
+            ),
+            
+            # Entry separators: blank lines or bullet points
+            'entry_split': re.compile(r'\n\s*\n|•|\*'),
         }
     
     def _load_skills_database(self) -> Dict[str, List[str]]:
@@ -189,14 +199,7 @@ class SimpleParser:
     
     def extract_education_section(self, text: str) -> str:
         """Extract education section from resume"""
-        education_markers = r'(?:EDUCATION|ACADEMIC|QUALIFICATIONS|DEGREES|SCHOOLING)'
-        section_markers = r'(?:EXPERIENCE|WORK|EMPLOYMENT|SKILLS|PROJECTS|CERTIFICATIONS|SUMMARY)'
-        
-        match = re.search(
-            f'{education_markers}[^\n]*\n(.*?)(?=\n\n?{section_markers}|$)',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        match = self.education_patterns['section'].search(text)
         
         return match.group(1) if match else text
     
@@ -208,7 +211,7 @@ class SimpleParser:
         edu_section = self.extract_education_section(text)
         
         # Split entries by double newline or bullet points
-        entries = re.split(r'\n\s*\n|•|\*', edu_section)
+        entries = self.education_patterns['entry_split'].split(edu_section)
         
         for entry in entries:
             if not entry.strip():
@@ -353,10 +356,7 @@ class SimpleParser:
         try:
             from PyPDF2 import PdfReader
             reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
-            return text
+            return "".join(page.extract_text() or "" for page in reader.pages)
         except Exception as e:
             raise ValueError(f"PDF extraction failed: {e}")
     
@@ -1,12 +1,24 @@
-import json
 import os
-from typing import List, Set
+from functools import lru_cache
+from typing import List, Optional, Set
 from difflib import SequenceMatcher
 
+import orjson
+
+try:
+    import rapidfuzz
+except Exception:
+    rapidfuzz = None
+
 class SkillsDatabase:
     def __init__(self):
         self.skills = self._load_skills()
         self.skills_lower = {s.lower(): s for s in self.skills}
+        # Built once so requests don't re-sort or re-lowercase the database
+        self._sorted_skills = sorted(self.skills)
+        self._search_index = [(s.lower(), s) for s in self._sorted_skills]
+        self._choices = list(self.skills_lower)
+        self._fuzzy_match = lru_cache(maxsize=4096)(self._find_fuzzy_match)
     
     def _load_skills(self) -> List[str]:
         """Load skills from skills.json"""
@@ -16,8 +28,8 @@ class SkillsDatabase:
         )
         
         try:
-            with open(skills_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(skills_path, 'rb') as f:
+                data = orjson.loads(f.read())
                 return data if isinstance(data, list) else data.get('skills', [])
         except Exception as e:
             print(f"Error loading skills: {e}")
@@ -25,16 +37,19 @@ class SkillsDatabase:
     
     def get_all_skills(self) -> List[str]:
         """Return all available skills"""
-        return sorted(self.skills)
+        return list(self._sorted_skills)
     
     def search_skills(self, query: str, limit: int = 10) -> List[str]:
         """Search skills by name"""
         query_lower = query.lower()
-        results = [
-            skill for skill in self.skills
-            if query_lower in skill.lower()
-        ]
-        return sorted(results)[:limit]
+        results = []
+        # Index is pre-sorted, so we can stop as soon as `limit` hits are found
+        for skill_lower, skill in self._search_index:
+            if query_lower in skill_lower:
+                results.append(skill)
+                if len(results) >= limit:
+                    break
+        return results
     
     def normalize_skill(self, skill: str) -> str:
         """Normalize skill name to match database"""
@@ -47,7 +62,17 @@ class SkillsDatabase:
         if skill_lower in self.skills_lower:
             return self.skills_lower[skill_lower]
         
-        # Fuzzy match (similarity > 80%)
+        # Fuzzy match (similarity > 80%), else return original
+        return self._fuzzy_match(skill_lower) or skill
+    
+    def _find_fuzzy_match(self, skill_lower: str) -> Optional[str]:
+        """Best database skill with similarity > 80%, memoized per input."""
+        if rapidfuzz is not None:
+            match = rapidfuzz.process.extractOne(
+                skill_lower, self._choices, scorer=rapidfuzz.fuzz.ratio, score_cutoff=80
+            )
+            return self.skills_lower[match[0]] if match is not None and match[1] > 80 else None
+        
         best_match = None
         best_ratio = 0.0
         
@@ -60,9 +85,7 @@ class SkillsDatabase:
         # Return fuzzy match if similarity > 0.8 (80%)
         if best_ratio > 0.8:
             return best_match
-        
-        # Return original if no good match
-        return skill
+        return None
     
     def standardize_skills(self, skills: List[str]) -> List[str]:
         """Normalize and deduplicate skills"""
@@ -75,7 +98,7 @@ class SkillsDatabase:
             if normalized:
                 standardized.add(normalized)
         
-        return sorted(list(standardized))
+        return sorted(standardized)
 
 # Create singleton instance
 skills_db = SkillsDatabase()
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import threading
 from typing import List, Tuple, Optional, Protocol, Dict
+
+import numpy as np
+
 from app.core.config import settings
 
+try:
+    import hnswlib
+except Exception:
+    hnswlib = None
+
+try:
+    import faiss
+except Exception:
+    faiss = None
+
 
 class VectorSearchClient(Protocol):
     """Protocol for vector search backends."""
@@ -23,49 +37,230 @@ class VectorSearchClient(Protocol):
         ...
 
 
-class InMemoryVectorSearch:
-    """Simple in-memory vector store for development and tests."""
+class _AnnIndex:
+    """HNSW graph over one namespace, updated in place as items are written.
+
+    Labels are handed out sequentially and never reused: a replaced or deleted
+    item's label is retired (``mark_deleted`` in hnswlib, skipped at query
+    time for faiss, which cannot drop vectors) and a new one is assigned.
+    """
 
-    def __init__(self) -> None:
-        self._store: Dict[str, Dict[str, Tuple[List[float], Dict]]] = {}
+    def __init__(self, dim: int, capacity: int) -> None:
+        self.labels: Dict[str, int] = {}
+        self.ids: List[Optional[str]] = []
+        self.dead = 0
+        if hnswlib is not None:
+            self.index = hnswlib.Index(space="ip", dim=dim)
+            self.index.init_index(max_elements=max(capacity, 1024), ef_construction=200, M=16)
+        else:
+            self.index = faiss.IndexHNSWFlat(dim, 32, faiss.METRIC_INNER_PRODUCT)
+            self.index.hnsw.efConstruction = 200
+
+    def add(self, ids: List[str], mat: np.ndarray) -> None:
+        self.remove(ids)
+        start = len(self.ids)
+        for offset, item_id in enumerate(ids):
+            self.labels[item_id] = start + offset
+        self.ids.extend(ids)
+        if hnswlib is not None:
+            capacity = self.index.get_max_elements()
+            if len(self.ids) > capacity:
+                self.index.resize_index(max(len(self.ids), capacity * 2))
+            self.index.add_items(mat, np.arange(start, len(self.ids)))
+        else:
+            # faiss numbers vectors in insertion order, matching our labels
+            self.index.add(mat)
+
+    def remove(self, ids: List[str]) -> None:
+        for item_id in ids:
+            label = self.labels.pop(item_id, None)
+            if label is None:
+                continue
+            self.ids[label] = None
+            self.dead += 1
+            if hnswlib is not None:
+                self.index.mark_deleted(label)
+
+    def search(self, q: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Return (id, cosine score) of the k nearest live items."""
+        k = min(k, len(self.labels))
+        if k <= 0:
+            return []
+        if hnswlib is not None:
+            self.index.set_ef(max(k * 2, 50))
+            labels, distances = self.index.knn_query(q, k=k)
+            labels, scores = labels[0], 1.0 - distances[0]
+        else:
+            # Over-fetch past retired labels, which faiss still returns
+            fetch = min(k + self.dead, len(self.ids))
+            self.index.hnsw.efSearch = max(fetch * 2, 64)
+            scores, labels = self.index.search(q.reshape(1, -1), fetch)
+            labels, scores = labels[0], scores[0]
+        hits = [(self.ids[label], float(score)) for label, score in zip(labels, scores) if label >= 0]
+        return [(item_id, score) for item_id, score in hits if item_id is not None][:k]
+
+
+class InMemoryVectorSearch:
+    """Simple in-memory vector store for development and tests.
+
+    Vectors are kept L2-normalized as float32 arrays. Queries stack a namespace
+    into one (N, D) matrix, cached until the next write, and score it with a
+    single BLAS matrix-vector product. Unfiltered queries on namespaces larger
+    than ``ann_threshold`` go through an HNSW graph when hnswlib (or, failing
+    that, faiss) is installed. The graph is built on the first such query and
+    then kept up to date by ``upsert`` and ``delete``; it is only rebuilt once
+    retired entries outnumber live ones.
+
+    Every vector in a namespace must have the same length: ``upsert`` rejects
+    a mismatched batch with ValueError, and a query vector of another length
+    matches nothing.
+
+    With ``quantize=True`` each vector is stored as int8 plus one float32
+    scale. Scoring then widens ``score_chunk_rows`` rows at a time, so the
+    matrix is read from memory at a quarter of the float32 size.
+    """
+
+    ann_threshold = 10_000
+    score_chunk_rows = 4096
+
+    def __init__(self, quantize: bool = False) -> None:
+        self.quantize = quantize
+        self._store: Dict[str, Dict[str, Tuple[np.ndarray, float, Dict]]] = {}
+        self._matrix: Dict[str, Tuple[List[str], np.ndarray, np.ndarray]] = {}
+        self._ann: Dict[str, _AnnIndex] = {}
+        # Writes keep the ANN graph in step with the store; hnswlib can't
+        # resize or mark_deleted while a query is running
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vec: List[float]) -> np.ndarray:
+        arr = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(arr))
+        return arr / norm if norm else arr
+
+    @staticmethod
+    def _quantize(vec: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Symmetric int8 quantization; returns (codes, scale) with vec ~= codes * scale."""
+        peak = float(np.max(np.abs(vec))) if vec.size else 0.0
+        scale = peak / 127.0 if peak else 1.0
+        codes = np.clip(np.round(vec / scale), -127, 127).astype(np.int8)
+        return codes, scale
+
+    def _stacked(self, namespace: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        cached = self._matrix.get(namespace)
+        if cached is None:
+            space = self._store.get(namespace, {})
+            ids = list(space)
+            mat = np.vstack([space[i][0] for i in ids]) if ids else np.empty((0, 0), dtype=np.float32)
+            scales = np.fromiter((space[i][1] for i in ids), dtype=np.float32, count=len(ids))
+            cached = (ids, mat, scales)
+            self._matrix[namespace] = cached
+        return cached
+
+    def _scores(self, mat: np.ndarray, scales: np.ndarray, q: np.ndarray) -> np.ndarray:
+        if mat.dtype != np.int8:
+            return mat @ q
+        # Widen one cache-sized block at a time instead of the whole matrix
+        scores = np.empty(mat.shape[0], dtype=np.float32)
+        step = self.score_chunk_rows
+        for start in range(0, mat.shape[0], step):
+            scores[start:start + step] = mat[start:start + step].astype(np.float32) @ q
+        return scores * scales
+
+    def _ann_index(self, namespace: str) -> _AnnIndex:
+        """The namespace's graph, built from the stacked matrix the first time. Call with the lock held."""
+        ann = self._ann.get(namespace)
+        if ann is None:
+            ids, mat, scales = self._stacked(namespace)
+            if mat.dtype == np.int8:
+                mat = mat.astype(np.float32) * scales[:, None]
+            # Rows are unit-length, so inner product equals cosine similarity
+            ann = _AnnIndex(mat.shape[1], len(ids))
+            ann.add(ids, mat)
+            self._ann[namespace] = ann
+        return ann
+
+    def _ann_update(self, namespace: str, upserted: Dict[str, np.ndarray], removed: List[str]) -> None:
+        """Apply a write to an existing graph. Call with the lock held."""
+        ann = self._ann.get(namespace)
+        if ann is None:
+            return
+        ann.remove(removed)
+        if upserted:
+            ann.add(list(upserted), np.vstack(list(upserted.values())))
+        if ann.dead > len(ann.labels):
+            # Mostly tombstones; let the next query build a compact graph
+            del self._ann[namespace]
 
     def upsert(self, namespace: str, items: List[Tuple[str, List[float], Dict]]) -> None:
-        space = self._store.setdefault(namespace, {})
-        for item_id, vec, meta in items:
-            space[item_id] = (vec, meta)
+        upserted: Dict[str, np.ndarray] = {}
+        units = [self._normalize(vec) for _, vec, _ in items]
+        with self._lock:
+            space = self._store.get(namespace)
+            dim = len(next(iter(space.values()))[0]) if space else (units[0].size if units else 0)
+            bad = sorted({unit.size for unit in units if unit.size != dim})
+            if bad:
+                raise ValueError(f"namespace {namespace!r} holds {dim}-dim vectors; got length(s) {bad}")
+            space = self._store.setdefault(namespace, {})
+            for (item_id, _, meta), unit in zip(items, units):
+                if self.quantize:
+                    space[item_id] = (*self._quantize(unit), meta)
+                else:
+                    space[item_id] = (unit, 1.0, meta)
+                upserted[item_id] = unit
+            self._matrix.pop(namespace, None)
+            self._ann_update(namespace, upserted, [])
 
     def query(self, namespace: str, vector: List[float], top_k: int = 10, filter: Optional[Dict] = None) -> List[Dict]:
-        import math
-
-        def cosine_similarity(a: List[float], b: List[float]) -> float:
-            dot = sum(x * y for x, y in zip(a, b))
-            na = math.sqrt(sum(x * x for x in a))
-            nb = math.sqrt(sum(y * y for y in b))
-            if na == 0 or nb == 0:
-                return 0.0
-            return dot / (na * nb)
+        with self._lock:
+            ids, mat, scales = self._stacked(namespace)
+            q = self._normalize(vector)
+            if not ids or top_k <= 0 or q.size != mat.shape[1]:
+                return []
+            space = self._store[namespace]
+            if (hnswlib is not None or faiss is not None) and not filter and len(ids) > self.ann_threshold:
+                hits = self._ann_index(namespace).search(q, top_k)
+                return [{"id": item_id, "score": score, "metadata": space[item_id][2]} for item_id, score in hits]
+
+        scores = self._scores(mat, scales, q)
+        if filter:
+            # Naive AND filter on metadata
+            rows = np.fromiter(
+                (i for i, item_id in enumerate(ids)
+                 if all(space[item_id][2].get(k) == v for k, v in filter.items())),
+                dtype=np.intp,
+            )
+        else:
+            rows = np.arange(len(ids))
+        if rows.size == 0:
+            return []
+
+        candidate_scores = scores[rows]
+        k = min(top_k, rows.size)
+        if k < rows.size:
+            top = np.argpartition(-candidate_scores, k - 1)[:k]
+        else:
+            top = np.arange(rows.size)
+        top = top[np.argsort(-candidate_scores[top], kind="stable")]
 
-        space = self._store.get(namespace, {})
         results = []
-        for item_id, (vec, meta) in space.items():
-            if filter:
-                # Naive AND filter on metadata
-                if not all(meta.get(k) == v for k, v in filter.items()):
-                    continue
-            score = cosine_similarity(vector, vec)
-            results.append({"id": item_id, "score": score, "metadata": meta})
-
-        results.sort(key=lambda r: r["score"], reverse=True)
-        return results[:top_k]
+        for j in top:
+            item_id = ids[rows[j]]
+            results.append({"id": item_id, "score": float(candidate_scores[j]), "metadata": space[item_id][2]})
+        return results
 
     def delete(self, namespace: str, ids: Optional[List[str]] = None) -> None:
-        if namespace not in self._store:
-            return
-        if ids is None:
-            del self._store[namespace]
-        else:
-            for _id in ids:
-                self._store[namespace].pop(_id, None)
+        with self._lock:
+            if namespace not in self._store:
+                return
+            self._matrix.pop(namespace, None)
+            if ids is None:
+                del self._store[namespace]
+                self._ann.pop(namespace, None)
+            else:
+                for _id in ids:
+                    self._store[namespace].pop(_id, None)
+                self._ann_update(namespace, {}, ids)
 
 
 class PineconeAdapter:
@@ -115,6 +310,7 @@ class QdrantAdapter:
         self.url = url or "http://localhost:6333"
         self.api_key = api_key
         self._client = None
+        self._collections: set = set()
 
     def _ensure(self):
         if self._client is not None:
@@ -125,8 +321,36 @@ class QdrantAdapter:
             raise RuntimeError("qdrant-client not installed") from e
         self._client = QdrantClient(url=self.url, api_key=self.api_key)
 
+    def _ensure_collection(self, namespace: str, dim: int) -> None:
+        """Create the collection with an int8-quantized index if it does not exist yet.
+
+        Clients keep sending FP32 vectors; Qdrant stores a 4x smaller int8 copy
+        for the search index and rescores with the originals.
+        """
+        if namespace in self._collections:
+            return
+        if not self._client.collection_exists(collection_name=namespace):
+            from qdrant_client.models import (
+                Distance,
+                ScalarQuantization,
+                ScalarQuantizationConfig,
+                ScalarType,
+                VectorParams,
+            )
+            self._client.create_collection(
+                collection_name=namespace,
+                vectors_config=VectorParams(size=dim, distance=Distance.COSINE),
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+                ),
+            )
+        self._collections.add(namespace)
+
     def upsert(self, namespace: str, items: List[Tuple[str, List[float], Dict]]) -> None:
         self._ensure()
+        if not items:
+            return
+        self._ensure_collection(namespace, len(items[0][1]))
         from qdrant_client.models import PointStruct
         points = [PointStruct(id=_id, vector=vec, payload=meta) for _id, vec, meta in items]
         self._client.upsert(collection_name=namespace, points=points)
@@ -144,6 +368,7 @@ class QdrantAdapter:
         self._ensure()
         if ids is None:
             self._client.delete_collection(collection_name=namespace)
+            self._collections.discard(namespace)
         else:
             self._client.delete(collection_name=namespace, points_selector=ids)
 
@@ -154,6 +379,6 @@ def get_vector_store() -> VectorSearchClient:
         return PineconeAdapter(settings.PINECONE_API_KEY, settings.PINECONE_ENVIRONMENT, settings.PINECONE_INDEX)
     if backend == "qdrant":
         return QdrantAdapter(settings.QDRANT_URL, settings.QDRANT_API_KEY)
-    return InMemoryVectorSearch()
+    return InMemoryVectorSearch(quantize=settings.VECTOR_QUANTIZE_INT8)
 
 
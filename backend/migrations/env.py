@@ -4,26 +4,19 @@ from dotenv import load_dotenv
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 # Import ALL models
-from app.core.config import settings
 from app.core.database import Base
 from app.models.users import User
 from app.models.candidate import Candidate
 from app.models.resume import Resume
 from app.models.jobs import Job
 from app.models.applications import Application
-from app.models.organizations import Organization
+from app.models.organization import Organization
 from app.models.screening_results import ScreeningResult
 
 load_dotenv()
 
-# Create engine
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
 database_url = os.getenv("DATABASE_URL", context.config.get_main_option("sqlalchemy.url"))
 context.config.set_main_option("sqlalchemy.url", database_url)
 
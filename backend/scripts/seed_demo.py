@@ -11,7 +11,7 @@ from app.models.candidate import Candidate
 from app.models.resume import Resume
 from app.models.applications import Application
 from app.models.screening_results import ScreeningResult
-from app.services.embeddings import get_embedding, vector_store
+from app.services.embeddings import get_embedding, get_embeddings, vector_store
 
 
 DEMO_UPLOADS_DIR = "./uploads"
@@ -55,10 +55,8 @@ async def seed_jobs(session) -> List[Job]:
     for j in jobs:
         session.add(j)
     await session.commit()
-    for j in jobs:
-        text = f"{j.title}\n{j.description}\n{j.requirements}"
-        vec = get_embedding(text[:5000])
-        vector_store.upsert("jobs", [(str(j.id), vec, {"title": j.title})])
+    vecs = get_embeddings([f"{j.title}\n{j.description}\n{j.requirements}" for j in jobs])
+    vector_store.upsert("jobs", [(str(j.id), vec, {"title": j.title}) for j, vec in zip(jobs, vecs)])
     return jobs
 
 
@@ -116,7 +114,7 @@ async def seed_candidates_and_resumes(session) -> List[Candidate]:
         session.add(r)
         await session.commit()
         emb_text = content + "\n" + " ".join(skills)
-        vec = get_embedding(emb_text[:5000])
+        vec = get_embedding(emb_text)
         vector_store.upsert("resumes", [(str(r.id), vec, {"filename": fname, "candidate_id": str(cand.id)})])
 
     return candidates
@@ -0,0 +1,104 @@
+import math
+
+from app.services.embeddings import _hashing_embedding
+
+
+def test_hashing_embedding_is_normalized_and_deterministic():
+    vec = _hashing_embedding("Python developer with Python and SQL", dim=64)
+    assert len(vec) == 64
+    assert abs(math.sqrt(sum(v * v for v in vec)) - 1.0) < 1e-6
+    assert vec == _hashing_embedding("python DEVELOPER with python and sql", dim=64)
+
+
+def test_hashing_embedding_empty_text():
+    assert _hashing_embedding("", dim=8) == [0.0] * 8
+    assert _hashing_embedding("   ", dim=8) == [0.0] * 8
+
+
+def test_get_embeddings_batches_and_caches(monkeypatch):
+    from types import SimpleNamespace
+    from app.services import embeddings
+
+    calls = []
+
+    class FakeEmbeddings:
+        def create(self, model, input):
+            calls.append(list(input))
+            data = [SimpleNamespace(index=i, embedding=[float(len(t))]) for i, t in enumerate(input)]
+            return SimpleNamespace(data=list(reversed(data)))
+
+    monkeypatch.setattr(embeddings, "_get_client", lambda: SimpleNamespace(embeddings=FakeEmbeddings()))
+    monkeypatch.setattr(embeddings, "_embedding_cache", embeddings.OrderedDict())
+    # Keep tiktoken's BPE download out of the test
+    monkeypatch.setattr(embeddings, "_get_tokenizer", lambda: None)
+
+    assert embeddings.get_embeddings(["a", "bbb", "a"]) == [[1.0], [3.0], [1.0]]
+    assert calls == [["a", "bbb"]]
+    assert embeddings.get_embedding("bbb") == [3.0]
+    assert len(calls) == 1
+
+
+def test_batched_hashing_matches_per_text_counts():
+    import numpy as np
+    from app.services.embeddings import HASHING_DIM, _hash_token, hashing_embeddings
+
+    texts = ["Python developer with Python and SQL", "", "Docker  kubernetes docker"]
+    mat = hashing_embeddings(texts, dim=64)
+    assert mat.shape == (3, 64)
+    for row, text in zip(mat, texts):
+        want = np.zeros(64)
+        for tok in text.lower().split():
+            want[_hash_token(tok) % 64] += 1
+        want /= np.linalg.norm(want) or 1.0
+        assert np.allclose(row, want, atol=1e-6)
+    assert hashing_embeddings([], dim=64).shape == (0, 64)
+    assert len(_hashing_embedding("python sql")) == HASHING_DIM
+
+
+def test_tokenizer_load_failure_falls_back_to_chars(monkeypatch):
+    import sys
+    from types import SimpleNamespace
+    from app.services import embeddings
+
+    attempts = []
+
+    def offline(model):
+        attempts.append(model)
+        raise ConnectionError("offline")
+
+    monkeypatch.setitem(sys.modules, "tiktoken", SimpleNamespace(encoding_for_model=offline))
+    embeddings._get_tokenizer.cache_clear()
+    try:
+        text = "x" * (embeddings.MAX_EMBEDDING_TOKENS * 5)
+        assert embeddings._truncate_tokens(text) == text[: embeddings.MAX_EMBEDDING_TOKENS * 4]
+        embeddings._truncate_tokens(text)
+        assert len(attempts) == 1
+    finally:
+        embeddings._get_tokenizer.cache_clear()
+
+
+def test_api_failures_fall_back_only_for_failed_texts(monkeypatch):
+    from types import SimpleNamespace
+    from app.services import embeddings
+
+    class Rejected(Exception):
+        status_code = 400
+
+    class FakeEmbeddings:
+        def create(self, model, input):
+            if "bad" in input:
+                raise Rejected("invalid input")
+            if "down" in input:
+                raise ConnectionError("timeout")
+            return SimpleNamespace(data=[SimpleNamespace(index=i, embedding=[1.0, 0.0]) for i in range(len(input))])
+
+    monkeypatch.setattr(embeddings, "_get_client", lambda: SimpleNamespace(embeddings=FakeEmbeddings()))
+    monkeypatch.setattr(embeddings, "_embedding_cache", embeddings.OrderedDict())
+    monkeypatch.setattr(embeddings, "_get_tokenizer", lambda: None)
+    monkeypatch.setattr(embeddings, "EMBEDDING_BATCH_SIZE", 4)
+
+    vecs = embeddings.get_embeddings(["a", "bad", "b", "c", "down", "d"])
+    assert [len(v) for v in vecs] == [2, embeddings.HASHING_DIM, 2, 2, embeddings.HASHING_DIM, embeddings.HASHING_DIM]
+    # Fallback vectors aren't cached, so a later call retries the API
+    assert embeddings.hashlib.sha1(b"bad").digest() not in embeddings._embedding_cache
+    assert embeddings.hashlib.sha1(b"a").digest() in embeddings._embedding_cache
@@ -79,6 +79,7 @@ def mock_parser(test_resume):
     # Ensure extract_experience/education return lists matching parse_resume
     mock.extract_experience.return_value = mock.parse_resume.return_value.get('experience', [])
     mock.extract_education.return_value = mock.parse_resume.return_value.get('education', [])
+    mock.parse_resume_async = AsyncMock(return_value=mock.parse_resume.return_value)
     return mock
 
 
@@ -114,7 +115,7 @@ async def test_parse_resume_endpoint_success(mock_parser, test_resume, db_sessio
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        with patch('app.api.v1.resumes.ResumeParser', return_value=mock_parser):
+        with patch('app.api.v1.resumes.get_resume_parser', return_value=mock_parser):
             response = await ac.post(
                 f"/api/v1/resumes/{resume_id}/parse",
                 headers={"Authorization": f"Bearer {token}"},
@@ -138,6 +139,19 @@ async def test_parse_resume_endpoint_success(mock_parser, test_resume, db_sessio
             experience = data["experience"][0]
             assert experience["company"] == "Tech Corp"
             assert experience["title"] == "Software Engineer"
+
+            # The text goes to its own column, not the JSON copy or the response
+            raw_text = mock_parser.parse_resume.return_value["raw_text"]
+            assert data["raw_text"] is None
+            assert mock_resume.raw_text == raw_text
+            assert mock_resume.parsed_data["raw_text"] is None
+
+            response = await ac.post(
+                f"/api/v1/resumes/{resume_id}/parse",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"use_rag": False, "extract_detailed": False, "include_raw_text": True}
+            )
+            assert response.json()["raw_text"] == raw_text
             
             app.dependency_overrides.pop(get_db, None)
 
@@ -220,10 +234,11 @@ async def test_parse_resume_file_error(db_session):
     # Create parser that raises error
     error_parser = MagicMock()
     error_parser.parse_resume.side_effect = FileParseError("Test error")
+    error_parser.parse_resume_async = AsyncMock(side_effect=FileParseError("Test error"))
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        with patch('app.api.v1.resumes.ResumeParser', return_value=error_parser):
+        with patch('app.api.v1.resumes.get_resume_parser', return_value=error_parser):
             response = await ac.post(
                 f"/api/v1/resumes/{resume_id}/parse",
                 headers={"Authorization": f"Bearer {token}"},
@@ -270,12 +285,13 @@ def test_parse_resume_with_rag(test_user_token, test_resume_id):
         "confidence_score": 0.5,
         "raw_text": ""
     }
+    rag_mock.aparse_resume = AsyncMock(return_value=rag_mock.parse_resume.return_value)
 
     async def _fake_get_db():
         yield mock_db_session
 
     app.dependency_overrides[get_db] = _fake_get_db
-    with patch('app.api.v1.resumes.RAGResumeParser', return_value=rag_mock):
+    with patch('app.api.v1.resumes.get_rag_resume_parser', return_value=rag_mock):
         from types import SimpleNamespace
         with patch('app.api.v1.resumes.settings', new=SimpleNamespace(USE_RAG_PARSER=True)):
             response = client.post(
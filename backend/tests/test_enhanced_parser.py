@@ -181,4 +181,335 @@ def test_skill_aliases_and_typos_extraction():
 
     # Expect canonicalized skill names from aliases/typos
     expected = {"Python", "JavaScript", "React", "Node.js", "Kubernetes", "PostgreSQL", "TensorFlow", "NLP"}
-    assert expected.issubset(set(skills)), f"Missing expected skills. Got: {skills}"
\ No newline at end of file
+    assert expected.issubset(set(skills)), f"Missing expected skills. Got: {skills}"
+
+def test_contact_and_years_extraction():
+    parser = ResumeParser()
+    text = (
+        "Jane Roe - jane.roe@example.com, alt: jr@example.org\n"
+        "3 years of experience in QA, then 7+ Years Experience in backend work\n"
+        "Phone: +1 (555) 123-4567"
+    )
+    assert parser.extract_email(text) == "jane.roe@example.com"
+    assert parser.extract_phone(text) == "+1 (555) 123-4567"
+    assert parser.calculate_experience_years(text) == 7
+    assert parser.calculate_experience_years("Acme 2015 - 2018\nGlobex 2018–2021") == 6
+    assert parser.calculate_experience_years("Acme 2015 - 2018\n4 years of experience\nGlobex 2018–2021") == 4
+    assert parser.extract_email("no contact here") is None
+
+
+def test_skill_automaton_matches_fallback_scan():
+    parser = ResumeParser()
+    if parser._skill_automata is None:
+        pytest.skip("pyahocorasick not installed")
+    text = (
+        "Senior engineer: Python3, FastAPI and PostgreSQL on AWS; CI/CD with Jenkins.\n"
+        "Built React Native apps, some C++ and Go, machine   learning with scikit-learn."
+    )
+    fast = parser.extract_skills(text)
+    parser._skill_automata = None
+    assert fast == parser.extract_skills(text)
+    assert {"Python", "FastAPI", "PostgreSQL", "React Native"} <= set(fast)
+
+
+def test_parse_resumes_matches_single_parse(sample_pdf, sample_docx):
+    parser = ResumeParser()
+    files = [
+        (sample_pdf, "application/pdf"),
+        (sample_pdf, "text/plain"),
+        (sample_docx, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    ]
+    batch = parser.parse_resumes(files)
+    assert batch == [parser.parse_resume(path, mime) for path, mime in files]
+    assert batch[1]["error"] == "Unsupported file type: text/plain"
+
+
+def test_parse_many_uses_worker_processes(sample_pdf, sample_docx):
+    from app.services import resumeparser
+    from app.services.resumeparser import parse_many
+
+    parser = ResumeParser()
+    files = [
+        (sample_pdf, "application/pdf"),
+        (sample_docx, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+        (sample_pdf, "text/plain"),
+    ]
+    expected = [parser.parse_resume(p, m) for p, m in files]
+    assert parse_many(files, max_workers=2) == expected
+    # The second batch reuses the same worker processes
+    assert parse_many(files, max_workers=2) == expected
+    assert len(resumeparser._worker_pools) == 1
+
+
+def test_pdf_extraction_stops_at_max_pages(tmp_path):
+    from app.services import resumeparser
+
+    if resumeparser.pymupdf is None:
+        pytest.skip("PyMuPDF not installed")
+    path = str(tmp_path / "long.pdf")
+    with resumeparser.pymupdf.open() as doc:
+        doc.new_page().insert_text((72, 72), "jane@example.com 5 years of experience")
+        for n in range(2, 6):
+            doc.new_page().insert_text((72, 72), f"Portfolio page {n}")
+        doc.save(path)
+
+    parser = ResumeParser()
+    assert "Portfolio page 2" not in parser.extract_text_from_pdf(path, max_pages=1)
+    assert "Portfolio page 5" in parser.extract_text_from_pdf(path)
+    by_chars = parser.extract_text_from_pdf(path, max_chars=50)
+    assert "Portfolio page 2" in by_chars and "Portfolio page 3" not in by_chars
+
+
+def test_pdfium_extraction_when_pymupdf_missing(tmp_path, monkeypatch):
+    from app.services import resumeparser
+
+    if resumeparser.pymupdf is None or resumeparser.pdfium is None:
+        pytest.skip("PyMuPDF and pypdfium2 are both needed to build and read the fixture")
+    path = str(tmp_path / "resume.pdf")
+    locked = str(tmp_path / "locked.pdf")
+    with resumeparser.pymupdf.open() as doc:
+        doc.new_page().insert_text((72, 72), "Jane Roe\njane@example.com")
+        doc.new_page().insert_text((72, 72), "Portfolio page 2")
+        doc.save(path)
+        doc.save(locked, encryption=resumeparser.pymupdf.PDF_ENCRYPT_AES_256, user_pw="u", owner_pw="o")
+
+    monkeypatch.setattr(resumeparser, "pymupdf", None)
+    parser = ResumeParser()
+    assert parser.extract_text_from_pdf(path) == "Jane Roe\njane@example.com\nPortfolio page 2"
+    assert "Portfolio" not in parser.extract_text_from_pdf(path, max_pages=1)
+    with pytest.raises(FileParseError):
+        parser.extract_text_from_pdf(locked)
+
+
+def test_long_pdf_pages_extracted_in_worker_processes(tmp_path, monkeypatch):
+    from app.services import resumeparser
+
+    if resumeparser.pymupdf is None:
+        pytest.skip("PyMuPDF not installed")
+    path = str(tmp_path / "portfolio.pdf")
+    with resumeparser.pymupdf.open() as doc:
+        for n in range(1, 21):
+            doc.new_page().insert_text((72, 72), f"Portfolio page {n}")
+        doc.save(path)
+
+    monkeypatch.setattr(resumeparser, "pymupdf", None)
+    monkeypatch.setattr(resumeparser, "pdfium", None)
+    parser = ResumeParser()
+    parallel = parser.extract_text_from_pdf(path)
+    assert parser._parallel_page_texts(path, 20)
+    monkeypatch.setattr(resumeparser, "PARALLEL_PDF_MIN_PAGES", 1000)
+    assert parallel == parser.extract_text_from_pdf(path)
+    assert parallel.index("Portfolio page 9") < parallel.index("Portfolio page 20")
+
+
+def test_streaming_docx_matches_python_docx(tmp_path):
+    from docx import Document
+    from docx.shared import Inches
+
+    path = str(tmp_path / "resume.docx")
+    doc = Document()
+    doc.add_paragraph("Jane Doe")
+    para = doc.add_paragraph()
+    para.paragraph_format.tab_stops.add_tab_stop(Inches(2))
+    para.add_run("Senior ").bold = True
+    para.add_run("Engineer\tAcme")
+    para.add_run().add_break()
+    para.add_run("2019 - 2023")
+    doc.add_paragraph("")
+    doc.add_paragraph("Python, SQL")
+    doc.save(path)
+
+    expected = "\n".join(p.text for p in Document(path).paragraphs)
+    assert ResumeParser._stream_docx_text(path) == expected
+    assert ResumeParser().extract_text_from_docx(path) == expected
+
+
+def test_parse_resume_is_cached_by_content(tmp_path, monkeypatch):
+    import shutil
+    from docx import Document
+    from app.services import resumeparser
+
+    monkeypatch.setattr(resumeparser, "_parse_cache", resumeparser.OrderedDict())
+    docx_mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    first, copy = str(tmp_path / "a.docx"), str(tmp_path / "b.docx")
+    doc = Document()
+    doc.add_paragraph("jane@example.com")
+    doc.add_paragraph("Python and SQL, 5 years of experience")
+    doc.save(first)
+    shutil.copyfile(first, copy)
+
+    parser = ResumeParser()
+    parsed = parser.parse_resume(first, docx_mime)
+    parsed["skills"].append("edited by caller")
+
+    def _no_read(*args, **kwargs):
+        raise AssertionError("cached resume was re-read")
+
+    monkeypatch.setattr(parser, "_read_text", _no_read)
+    again = parser.parse_resume(copy, docx_mime)
+    assert again["personal_info"]["email"] == "jane@example.com"
+    assert "edited by caller" not in again["skills"]
+
+
+def test_long_resume_runs_ner_on_pool(tmp_path, monkeypatch):
+    import threading
+    from docx import Document
+    from app.services import resumeparser
+
+    monkeypatch.setattr(resumeparser, "_parse_cache", resumeparser.OrderedDict())
+    path = str(tmp_path / "long.docx")
+    doc = Document()
+    doc.add_paragraph("jane@example.com")
+    doc.add_paragraph("Python developer. " * (resumeparser.PARALLEL_NER_MIN_CHARS // 10))
+    doc.save(path)
+
+    threads = []
+
+    def fake_ner(text):
+        threads.append(threading.current_thread().name)
+        return {"name": "Jane Doe", "company": None}
+
+    parser = ResumeParser()
+    parser.nlp = object()
+    monkeypatch.setattr(parser, "_extract_with_spacy", fake_ner)
+    parsed = parser.parse_resume(path, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
+    assert parsed["personal_info"]["name"] == "Jane Doe"
+    assert parsed["personal_info"]["email"] == "jane@example.com"
+    assert threads and threads[0].startswith("resume-ner")
+
+
+def test_name_heuristic_reads_the_header():
+    assert ResumeParser.extract_name("\n  Jane Doe \njane@example.com\n") == "Jane Doe"
+    assert ResumeParser.extract_name("RESUME\nMary-Ann O'Neil\nPython") == "Mary-Ann O'Neil"
+    assert ResumeParser.extract_name("John Q. Public\n") == "John Q. Public"
+    assert ResumeParser.extract_name("Senior Software Engineer\njane@example.com") is None
+    assert ResumeParser.extract_name("Curriculum Vitae\n") is None
+    assert ResumeParser.extract_name("a\nb\nc\nJane Doe") is None
+
+
+def test_ner_reads_header_before_full_text():
+    from types import SimpleNamespace
+    from app.services import resumeparser
+
+    seen = []
+
+    def fake_nlp(text):
+        seen.append(len(text))
+        ents = [SimpleNamespace(label_="PERSON", text="Jane Doe")] if "Jane" in text else []
+        return SimpleNamespace(ents=ents)
+
+    parser = ResumeParser()
+    parser.nlp = fake_nlp
+    header = resumeparser.NER_HEADER_CHARS
+    assert parser._extract_with_spacy("Jane " + "x" * 3 * header)["name"] == "Jane Doe"
+    assert seen == [header]
+    seen.clear()
+    assert parser._extract_with_spacy("x" * 3 * header + " Jane")["name"] == "Jane Doe"
+    assert seen == [header, 3 * header + 5]
+
+
+def test_high_accuracy_setting_prefers_transformer_model(monkeypatch):
+    from app.services import resumeparser
+
+    requested = []
+    monkeypatch.setattr(resumeparser, "_load_spacy_model", lambda models, pipes: requested.append(models))
+    ResumeParser().nlp
+    monkeypatch.setattr(resumeparser.settings, "SPACY_HIGH_ACCURACY", True)
+    ResumeParser().nlp
+    assert requested == [("en_core_web_sm", "en_core_web_trf"), ("en_core_web_trf", "en_core_web_sm")]
+
+
+def test_parsers_share_skill_index():
+    first, second = ResumeParser(), ResumeParser()
+    assert first.skill_map is second.skill_map
+    assert first.skills_standardizer is second.skills_standardizer
+
+
+def test_concurrent_first_use_builds_skill_index_once(monkeypatch):
+    import threading
+    import time
+    from app.services import resumeparser
+
+    builds = []
+    real_load = ResumeParser._load_skill_database
+
+    def slow_load():
+        builds.append(1)
+        time.sleep(0.05)
+        return real_load()
+
+    monkeypatch.setattr(ResumeParser, "_load_skill_database", staticmethod(slow_load))
+    resumeparser._shared_skill_index.cache_clear()
+    try:
+        threads = [threading.Thread(target=ResumeParser) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(builds) == 1
+    finally:
+        resumeparser._shared_skill_index.cache_clear()
+
+
+def test_parse_resumes_async_matches_sync(sample_pdf):
+    import asyncio
+
+    parser = ResumeParser()
+    files = [(sample_pdf, "application/pdf"), (sample_pdf, "text/plain")]
+    assert asyncio.run(parser.parse_resumes_async(files)) == [parser.parse_resume(p, m) for p, m in files]
+
+
+def test_thread_pool_is_created_once_under_concurrency():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from app.services import resumeparser
+
+    barrier = threading.Barrier(8)
+
+    def get():
+        barrier.wait()
+        return resumeparser._get_thread_pool("test-concurrent", 1)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        pools = list(ex.map(lambda _: get(), range(8)))
+    assert all(pool is pools[0] for pool in pools)
+    resumeparser._thread_pools.pop("test-concurrent").shutdown()
+
+
+def test_broken_pdf_pool_is_replaced(monkeypatch):
+    from concurrent.futures.process import BrokenProcessPool
+    from app.services import resumeparser
+
+    class BrokenPool:
+        shut_down = False
+
+        def submit(self, *args):
+            raise BrokenProcessPool("worker killed")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    broken = BrokenPool()
+    monkeypatch.setattr(resumeparser, "_pdf_pool", broken)
+    assert ResumeParser._parallel_page_texts("missing.pdf", 20) == []
+    assert broken.shut_down
+    assert resumeparser._pdf_pool is None
+
+
+def test_pdf_backends_separate_pages_alike(tmp_path, monkeypatch):
+    from app.services import resumeparser
+
+    if resumeparser.pymupdf is None:
+        pytest.skip("PyMuPDF not installed")
+    path = str(tmp_path / "two_pages.pdf")
+    with resumeparser.pymupdf.open() as doc:
+        doc.new_page().insert_text((72, 72), "Python")
+        doc.new_page().insert_text((72, 72), "Experience")
+        doc.save(path)
+
+    parser = ResumeParser()
+    for backend in ("pymupdf", "pdfium"):
+        monkeypatch.setattr(resumeparser, backend, None)
+        text = parser.extract_text_from_pdf(path)
+        assert "PythonExperience" not in text
+        assert text.split() == ["Python", "Experience"]
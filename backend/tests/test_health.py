@@ -16,3 +16,32 @@ def test_api_response_structure():
     data = response.json()
     assert "status" in data
     assert "message" in data
+
+def test_middleware_headers():
+    """Test request-id and security headers are added to responses"""
+    response = client.get("/api/v1/health")
+    assert response.headers["X-Request-ID"]
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-Frame-Options"] == "DENY"
+
+def test_cors_preflight_is_cacheable():
+    """Test CORS preflight advertises the allowed headers and a max-age"""
+    response = client.options(
+        "/api/v1/health",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "Authorization",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["Access-Control-Max-Age"] == "86400"
+    assert "Authorization" in response.headers["Access-Control-Allow-Headers"]
+
+def test_metrics_use_route_template():
+    """Test request metrics are labelled by route template, not raw path"""
+    from app.core.metrics import _request_counts
+    client.get("/api/v1/tasks/some-task-id")
+    paths = {path for path, _ in _request_counts}
+    assert "/api/v1/tasks/{task_id}" in paths
+    assert "/api/v1/tasks/some-task-id" not in paths
@@ -0,0 +1,21 @@
+import time
+import uuid
+
+from app.core.ids import uuid7
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+    assert isinstance(value, uuid.UUID)
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_current_time_and_sorts_by_it():
+    before = time.time_ns() // 1_000_000
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first.int >> 80 >= before
+    assert first < second
+    assert len({uuid7() for _ in range(1000)}) == 1000
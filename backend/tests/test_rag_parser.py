@@ -0,0 +1,153 @@
+import asyncio
+import json
+
+from app.services import rag_resume_parser
+from app.services.rag_resume_parser import RAGResumeParser, _section_snippets
+
+RESUME = """Jane Doe
+jane@example.com | +1 555 0100
+
+Skills:
+Python, SQL
+
+Projects
+Internal tooling
+
+Experience
+Engineer at Acme, 2019 - 2023
+
+Education
+BSc Computer Science
+"""
+
+
+class _FakeSectionChain:
+    def __init__(self):
+        self.calls = []
+
+    def _answer(self, inputs):
+        self.calls.append(inputs["snippet"])
+        key = inputs["json_format"].split('"')[1]
+        return json.dumps({key: [inputs["snippet"]]})
+
+    def batch(self, inputs_list):
+        return [self._answer(inputs) for inputs in inputs_list]
+
+    async def ainvoke(self, inputs):
+        return self._answer(inputs)
+
+
+def _parser(monkeypatch):
+    monkeypatch.setattr(rag_resume_parser, "_section_cache", rag_resume_parser.OrderedDict())
+    parser = RAGResumeParser()
+    parser.chain = object()
+    parser.section_chain = _FakeSectionChain()
+    monkeypatch.setattr(parser, "extract_text_from_file", lambda filepath, mimetype: RESUME)
+    return parser
+
+
+def test_section_snippets_stop_at_next_heading():
+    sections = dict(_section_snippets(RESUME))
+    assert sections["contact"] == "Jane Doe\njane@example.com | +1 555 0100"
+    assert sections["skills"] == "Python, SQL"
+    assert sections["experience"] == "Engineer at Acme, 2019 - 2023"
+    assert sections["education"] == "BSc Computer Science"
+    assert _section_snippets("no headings here") == []
+
+
+def test_section_responses_are_merged_and_cached(monkeypatch):
+    parser = _parser(monkeypatch)
+    parsed = parser.parse_resume("resume.pdf", "application/pdf")
+    assert parsed["skills"] == ["Python, SQL"]
+    assert parsed["education"] == ["BSc Computer Science"]
+    assert parsed["raw_text"] == RESUME
+    assert len(parser.section_chain.calls) == 4
+
+    again = asyncio.run(parser.aparse_resume("resume.pdf", "application/pdf"))
+    assert again == parsed
+    assert len(parser.section_chain.calls) == 4
+
+
+def test_cached_sections_are_not_shared_with_callers(monkeypatch):
+    parser = _parser(monkeypatch)
+    parsed = parser.parse_resume("resume.pdf", "application/pdf")
+    parsed["skills"].append("Injected")
+
+    again = parser.parse_resume("resume.pdf", "application/pdf")
+    assert again["skills"] == ["Python, SQL"]
+    again["education"].clear()
+    assert parser.parse_resume("resume.pdf", "application/pdf")["education"] == ["BSc Computer Science"]
+
+
+def test_invalid_section_json_falls_back_to_full_prompt(monkeypatch):
+    parser = _parser(monkeypatch)
+    answer = parser.section_chain._answer
+    parser.section_chain._answer = (
+        lambda inputs: "not json" if "education" in inputs["json_format"] else answer(inputs)
+    )
+
+    class FullChain:
+        def invoke(self, inputs):
+            return json.dumps({"skills": ["Python"], "education": ["BSc"]})
+
+        async def ainvoke(self, inputs):
+            return self.invoke(inputs)
+
+    parser.chain = FullChain()
+    assert parser.parse_resume("resume.pdf", "application/pdf")["education"] == ["BSc"]
+    assert asyncio.run(parser.aparse_resume("resume.pdf", "application/pdf"))["education"] == ["BSc"]
+
+
+def test_missing_section_heading_falls_back_to_full_prompt(monkeypatch):
+    parser = _parser(monkeypatch)
+    partial = "Jane Doe\njane@example.com\n\nSkills:\nPython, SQL\n"
+    monkeypatch.setattr(parser, "extract_text_from_file", lambda filepath, mimetype: partial)
+    assert _section_snippets(partial) == []
+
+    class FullChain:
+        def invoke(self, inputs):
+            return json.dumps({"skills": ["Python"], "experience": [], "education": []})
+
+    parser.chain = FullChain()
+    assert parser.parse_resume("resume.pdf", "application/pdf")["experience"] == []
+    assert parser.section_chain.calls == []
+
+
+def test_full_prompt_retries_alike_sync_and_async(monkeypatch):
+    parser = _parser(monkeypatch)
+    monkeypatch.setattr(rag_resume_parser, "_section_snippets", lambda text: [])
+    sleeps = []
+
+    async def fake_async_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(rag_resume_parser.time, "sleep", sleeps.append)
+    monkeypatch.setattr(rag_resume_parser.asyncio, "sleep", fake_async_sleep)
+
+    class FlakyChain:
+        def __init__(self, failures, output):
+            self.failures = failures
+            self.output = output
+
+        def invoke(self, inputs):
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("timeout")
+            return self.output
+
+        async def ainvoke(self, inputs):
+            return self.invoke(inputs)
+
+    parser.chain = FlakyChain(1, '{"skills": ["Python"]}')
+    assert parser.parse_resume("resume.pdf", "application/pdf")["skills"] == ["Python"]
+    parser.chain = FlakyChain(1, '{"skills": ["Python"]}')
+    assert asyncio.run(parser.aparse_resume("resume.pdf", "application/pdf"))["skills"] == ["Python"]
+    assert sleeps == [1, 1]
+
+    sleeps.clear()
+    parser.chain = FlakyChain(5, "")
+    failed = asyncio.run(parser.aparse_resume("resume.pdf", "application/pdf"))
+    assert failed["error"] == "timeout" and sleeps == [1, 2]
+
+    parser.chain = FlakyChain(0, '["not", "an", "object"]')
+    assert parser.parse_resume("resume.pdf", "application/pdf")["raw_output"] == '["not", "an", "object"]'
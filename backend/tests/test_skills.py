@@ -22,3 +22,24 @@ def test_no_false_positives_on_empty_text():
     rp = ResumeParser()
     skills = rp.extract_skills("")
     assert skills == []
+
+
+def test_fuzzy_skill_match_agrees_with_sequencematcher(monkeypatch):
+    from app.services import resumeparser
+
+    if resumeparser.rapidfuzz is None:
+        pytest.skip("rapidfuzz not installed")
+    standardizer = ResumeParser().skills_standardizer
+    inputs = ["Pyton", "Javascrpt", "Kubernets", "Postgresql db", "underwater basket weaving"]
+    fast = [standardizer.normalize_skill(s) for s in inputs]
+    monkeypatch.setattr(resumeparser, "rapidfuzz", None)
+    assert fast == [standardizer.normalize_skill(s) for s in inputs]
+    assert fast[0] == "Python" and fast[-1] == "underwater basket weaving"
+
+
+def test_fuzzy_match_only_scores_trigram_candidates():
+    standardizer = ResumeParser().skills_standardizer
+    candidates = standardizer._fuzzy_candidates("kubernets")
+    assert "kubernetes" in candidates
+    assert len(candidates) < len(standardizer.skills_lower)
+    assert standardizer.normalize_skill("Kubernets") == "Kubernetes"
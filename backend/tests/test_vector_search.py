@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from app.services import vector_search
+from app.services.vector_search import InMemoryVectorSearch
+
+
+def test_query_orders_by_cosine_similarity():
+    store = InMemoryVectorSearch()
+    store.upsert("resumes", [
+        ("a", [1.0, 0.0, 0.0], {"kind": "x"}),
+        ("b", [0.7, 0.7, 0.0], {"kind": "y"}),
+        ("c", [0.0, 0.0, 1.0], {"kind": "x"}),
+    ])
+    results = store.query("resumes", [2.0, 0.0, 0.0], top_k=2)
+    assert [r["id"] for r in results] == ["a", "b"]
+    assert abs(results[0]["score"] - 1.0) < 1e-6
+
+
+def test_query_applies_metadata_filter():
+    store = InMemoryVectorSearch()
+    store.upsert("resumes", [
+        ("a", [1.0, 0.0], {"kind": "x"}),
+        ("b", [0.9, 0.1], {"kind": "y"}),
+    ])
+    results = store.query("resumes", [1.0, 0.0], filter={"kind": "y"})
+    assert [r["id"] for r in results] == ["b"]
+
+
+def test_upsert_and_delete_refresh_results():
+    store = InMemoryVectorSearch()
+    store.upsert("jobs", [("a", [1.0, 0.0], {})])
+    assert [r["id"] for r in store.query("jobs", [1.0, 0.0])] == ["a"]
+
+    store.upsert("jobs", [("b", [1.0, 0.0], {}), ("a", [0.0, 1.0], {})])
+    assert [r["id"] for r in store.query("jobs", [1.0, 0.0], top_k=1)] == ["b"]
+
+    store.delete("jobs", ["b"])
+    assert [r["id"] for r in store.query("jobs", [1.0, 0.0])] == ["a"]
+    store.delete("jobs")
+    assert store.query("jobs", [1.0, 0.0]) == []
+
+
+def test_ann_path_matches_exact_search():
+    if vector_search.hnswlib is None and vector_search.faiss is None:
+        pytest.skip("no ANN library installed")
+
+    rng = np.random.default_rng(0)
+    vecs = rng.normal(size=(300, 16)).astype(np.float32)
+    store = InMemoryVectorSearch()
+    store.upsert("resumes", [(str(i), v.tolist(), {}) for i, v in enumerate(vecs)])
+    exact = store.query("resumes", vecs[7].tolist(), top_k=5)
+
+    store.ann_threshold = 100
+    approx = store.query("resumes", vecs[7].tolist(), top_k=5)
+    assert approx[0]["id"] == "7"
+    assert abs(approx[0]["score"] - 1.0) < 1e-4
+    assert len({r["id"] for r in approx} & {r["id"] for r in exact}) >= 4
+
+
+def test_int8_store_matches_float_ranking():
+    rng = np.random.default_rng(1)
+    vecs = rng.normal(size=(50, 32)).astype(np.float32)
+    items = [(str(i), v.tolist(), {}) for i, v in enumerate(vecs)]
+    exact, quantized = InMemoryVectorSearch(), InMemoryVectorSearch(quantize=True)
+    quantized.score_chunk_rows = 16
+    exact.upsert("resumes", items)
+    quantized.upsert("resumes", items)
+
+    assert quantized._stacked("resumes")[1].dtype == np.int8
+    want = {r["id"]: r["score"] for r in exact.query("resumes", vecs[3].tolist(), top_k=50)}
+    got = quantized.query("resumes", vecs[3].tolist(), top_k=5)
+    assert got[0]["id"] == "3"
+    for r in got:
+        assert abs(want[r["id"]] - r["score"]) < 2e-2
+
+
+@pytest.mark.parametrize("backend", ["hnswlib", "faiss"])
+def test_ann_index_follows_writes_without_rebuilding(monkeypatch, backend):
+    if getattr(vector_search, backend) is None:
+        pytest.skip(f"{backend} not installed")
+    if backend == "faiss":
+        monkeypatch.setattr(vector_search, "hnswlib", None)
+
+    rng = np.random.default_rng(2)
+    vecs = rng.normal(size=(200, 16)).astype(np.float32)
+    store = InMemoryVectorSearch()
+    store.ann_threshold = 50
+    store.upsert("resumes", [(str(i), v.tolist(), {}) for i, v in enumerate(vecs)])
+    assert store.query("resumes", vecs[5].tolist(), top_k=1)[0]["id"] == "5"
+    index = store._ann["resumes"]
+
+    fresh = rng.normal(size=16).astype(np.float32)
+    store.upsert("resumes", [("new", fresh.tolist(), {"v": 1}), ("5", (-vecs[5]).tolist(), {})])
+    store.delete("resumes", ["7"])
+    assert store._ann["resumes"] is index
+
+    top = store.query("resumes", fresh.tolist(), top_k=1)[0]
+    assert top["id"] == "new" and top["metadata"] == {"v": 1}
+    assert "5" not in [r["id"] for r in store.query("resumes", vecs[5].tolist(), top_k=3)]
+    assert "7" not in [r["id"] for r in store.query("resumes", vecs[7].tolist(), top_k=3)]
+
+    store.delete("resumes", [str(i) for i in range(150)])
+    assert "resumes" not in store._ann
+    assert store.query("resumes", vecs[160].tolist(), top_k=1)[0]["id"] == "160"
+
+
+def test_mixed_dimensions_are_rejected_not_fatal():
+    store = InMemoryVectorSearch()
+    store.upsert("resumes", [("a", [1.0, 0.0, 0.0], {}), ("b", [0.0, 1.0, 0.0], {})])
+
+    with pytest.raises(ValueError):
+        store.upsert("resumes", [("c", [1.0, 0.0, 0.0], {}), ("d", [1.0, 0.0], {})])
+    # The rejected batch is not partially applied
+    assert {r["id"] for r in store.query("resumes", [1.0, 1.0, 0.0])} == {"a", "b"}
+
+    assert store.query("resumes", [1.0, 0.0]) == []
+    assert store.query("resumes", [1.0, 0.0], filter={"kind": "x"}) == []